@@ -1,17 +1,57 @@
 # __init__.py
+# Names are imported lazily, on first access, so an application only loads the modules (and their dependencies)
+# for the controls it uses - `from aic import RotaryDial` imports the rotary_dial module alone
 
-from .active_image_control import ActiveImageControl
-from .image_control_frame import ImageControlFrame
-from .image_control_panel import ImageControlPanel
-from .led_single import LedSingle
-from .led_array import LedArray
-from .led_matrix import LedMatrix
-from .toggle_switch import ToggleSwitch
-from .moment_switch import MomentSwitch
-from .rotary_dial import RotaryDial
-from .rotary_switch import RotarySwitch
-from .simple_slider import SimpleSlider
-from .simple_slide_switch import SimpleSlideSwitch
-from .range_slider import RangeSlider
-from .util import dc_to_bitmap, save_bmp_to_file
-from .util import make_padding, Padding
+import importlib
+
+_exports = {
+    'ActiveImageControl': 'active_image_control',
+    'EVENT_IMMEDIATE': 'active_image_control',
+    'EVENT_THROTTLED': 'active_image_control',
+    'EVENT_DEBOUNCED': 'active_image_control',
+    'EVENT_ON_RELEASE': 'active_image_control',
+    'ImageControlFrame': 'image_control_frame',
+    'ImageControlPanel': 'image_control_panel',
+    'LedSingle': 'led_single',
+    'LedArray': 'led_array',
+    'LedMatrix': 'led_matrix',
+    'ToggleSwitch': 'toggle_switch',
+    'MomentSwitch': 'moment_switch',
+    'RotaryDial': 'rotary_dial',
+    'RotarySwitch': 'rotary_switch',
+    'SimpleSlider': 'simple_slider',
+    'SimpleSlideSwitch': 'simple_slide_switch',
+    'RangeSlider': 'range_slider',
+    'WindowlessControl': 'windowless',
+    'WindowlessLed': 'windowless',
+    'WindowlessToggle': 'windowless',
+    'dc_to_bitmap': 'util',
+    'save_bmp_to_file': 'util',
+    'tile_bitmap': 'util',
+    'make_padding': 'util',
+    'Padding': 'util',
+    'load_bitmap': 'resources',
+    'resource_stats': 'resources',
+    'load_atlas': 'atlas',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    module_name = _exports.get(name)
+    if module_name is None:
+        # a submodule (eg aic.util, aic.rotary_dial) is still reachable as an attribute after `import aic`
+        try:
+            return importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as error:
+            if error.name != f'{__name__}.{name}':
+                raise  # the submodule exists, but something it imports doesn't
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # later lookups don't come through here
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
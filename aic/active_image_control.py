@@ -1,7 +1,22 @@
+import time
+from collections import OrderedDict
+
 import wx
+from .util.animation import get_animator, linear
+from .util.mailbox import get_mailbox
+from .util import instrument
+from .util.refresh import RefreshHoldMixin
+
+# Change event policies - see ActiveImageControl.set_event_policy
+EVENT_IMMEDIATE = 'immediate'
+EVENT_THROTTLED = 'throttled'
+EVENT_DEBOUNCED = 'debounced'
+EVENT_ON_RELEASE = 'release'
+
+RENDER_BYTE_BUDGET = 2 * 1024 ** 2  # approximate pixel memory allowed per control for memoized images (32bpp)
 
 
-class ActiveImageControl(wx.Control):
+class ActiveImageControl(RefreshHoldMixin, wx.Control):
     """ A sub-classed Control utilising images to behave as controls """
 
     def __init__(self, parent, *args, **kwargs):
@@ -9,44 +24,312 @@ class ActiveImageControl(wx.Control):
 
         self.highlight = False
 
+        self._bg_slice = None       # this control's portion of the parent's rendered background
+        self._bg_slice_key = None   # (window rect, parent background generation) that the slice was taken from
+        self._base = None           # the background slice with the static layer drawn over it
+        self._base_key = None       # (background slice key, static layer position) that the base was composed for
+        self._base_static = None    # the static layer bitmap the base was composed with
+        self._renders = OrderedDict()  # complete control images, least recently used first -> {(state, highlight): bmp}
+        self.renders_max_bytes = RENDER_BYTE_BUDGET  # None for no limit
+        self._renders_key = None    # background slice key that the images were composed over
+        self._renders_skin = ()     # the bitmaps that the images were composed from
+
         self.animate_timer = wx.Timer(self, wx.ID_OK)
 
+        self._evt_policy = EVENT_IMMEDIATE
+        self._evt_interval = 0.05       # seconds - the throttle period or the debounce delay
+        self._evt_pending = None        # (event class, kwargs) of the latest change not yet posted
+        self._evt_coalesced = 0         # number of changes represented by the pending event
+        self._evt_last_post = 0.0
+        self._evt_timer = None
+        self._pressed = False           # True from a left-button press on the control until its release
+
+        self._wheel_rotation = 0        # scroll-wheel rotation accumulated since the last frame
+        self._wheel_delta = 120
+
         self.Bind(wx.EVT_ERASE_BACKGROUND, self._on_erase_background)
         self.Bind(wx.EVT_SET_FOCUS, self._on_focus_change)
         self.Bind(wx.EVT_KILL_FOCUS, self._on_focus_change)
+        self.Bind(wx.EVT_LEFT_DCLICK, self._on_double_click)
+        self.Bind(wx.EVT_LEFT_UP, self._on_release)
+        self.Bind(wx.EVT_MOUSE_CAPTURE_LOST, self._on_capture_lost)
 
     def _on_erase_background(self, _):
         pass
 
+    def Refresh(self, eraseBackground=True, rect=None):
+        instrument.record_refresh(self)
+        super().Refresh(eraseBackground, rect)
+
+    def RefreshRect(self, rect, eraseBackground=True):
+        instrument.record_refresh(self)
+        super().RefreshRect(rect, eraseBackground)
+
     def _on_focus_change(self, event):
+        if (event.GetEventType() == wx.wxEVT_KILL_FOCUS and self._evt_policy == EVENT_ON_RELEASE
+                and not self.is_animating()):
+            self.flush_events()
         self.Refresh()
         event.Skip()
 
+    def _begin_press(self):
+        """ Called by a subclass's left-down handler, before it changes the value; changes made until the button
+            is released come from the user's interaction with this control (see set_event_policy)
+        """
+        self._pressed = True
+
+    def _on_double_click(self, event):
+        self._begin_press()
+        event.Skip()
+
+    def _on_release(self, event):
+        self.flush_input('drag')  # apply the final drag position before anything else sees the release
+        self._end_press()
+        event.Skip()
+
+    def _on_capture_lost(self, _):
+        self.flush_input('drag')
+        self._end_press()
+
+    def _end_press(self):
+        self._pressed = False
+        if self.HasCapture():
+            self.ReleaseMouse()
+        if self._evt_policy == EVENT_ON_RELEASE and not self.is_animating():
+            self.flush_events()  # a tween started by the press posts its event when it completes
+
+    def _on_event_timer(self, _):
+        self.flush_events()
+
+    # Change events #
+    def set_event_policy(self, policy=EVENT_IMMEDIATE, interval=0.05):
+        """
+        Set how change events are posted while the control's value is changing
+            EVENT_IMMEDIATE:    an event for every change
+            EVENT_THROTTLED:    at most one event per interval (seconds)
+            EVENT_DEBOUNCED:    a single event once the value has been still for interval (seconds)
+            EVENT_ON_RELEASE:   a single event when the (left) mouse button, pressed on the control, is released;
+                                animated changes are posted once the animation completes and any other changes
+                                (keys, scroll-wheel, value set by the application...) are posted immediately
+        Throttled, debounced and on-release events carry the latest value only; every event has .coalesced - the
+        number of changes the event represents (always 1 for immediate events)
+        """
+        if policy not in (EVENT_IMMEDIATE, EVENT_THROTTLED, EVENT_DEBOUNCED, EVENT_ON_RELEASE):
+            raise ValueError(f'Unknown event policy: {policy}')
+        self.flush_events()
+        self._evt_policy = policy
+        self._evt_interval = interval
+
+    def post_event(self, event_class, **kwargs):
+        """ Post a change event (a NewCommandEvent class) according to the control's event policy """
+        policy = self._evt_policy
+        if policy == EVENT_IMMEDIATE:
+            instrument.record_event(self)
+            wx.PostEvent(self, event_class(id=self.GetId(), coalesced=1, **kwargs))
+            return
+
+        self._evt_pending = (event_class, kwargs)
+        self._evt_coalesced += 1
+
+        if policy == EVENT_THROTTLED:
+            remaining = self._evt_interval - (time.perf_counter() - self._evt_last_post)
+            if remaining <= 0:
+                self.flush_events()
+            elif not self._get_event_timer().IsRunning():
+                self._evt_timer.StartOnce(max(1, int(remaining * 1000)))
+        elif policy == EVENT_DEBOUNCED:
+            self._get_event_timer().StartOnce(max(1, int(self._evt_interval * 1000)))
+        elif self._pressed:
+            if not self.HasCapture():
+                self.CaptureMouse()  # so that the release is seen (and the event posted) even outside the control
+        elif not self.is_animating():
+            self.flush_events()
+
+    def flush_events(self):
+        """ Post any pending (coalesced) change event now """
+        if self._evt_timer is not None:
+            self._evt_timer.Stop()
+        if self._evt_pending is None:
+            return
+        event_class, kwargs = self._evt_pending
+        coalesced = self._evt_coalesced
+        self._evt_pending = None
+        self._evt_coalesced = 0
+        self._evt_last_post = time.perf_counter()
+        instrument.record_event(self)
+        wx.PostEvent(self, event_class(id=self.GetId(), coalesced=coalesced, **kwargs))
+
+    def _get_event_timer(self):
+        if self._evt_timer is None:
+            self._evt_timer = wx.Timer(self)
+            self.Bind(wx.EVT_TIMER, self._on_event_timer, self._evt_timer)
+        return self._evt_timer
+
+    # Thread-safe updates #
+    def post_value(self, value, setter=None):
+        """ Set the control's value from any thread; only the newest value is applied, once per frame
+            setter is the method used to apply it (eg RotaryDial.set_angle), the .value property by default
+        """
+        get_mailbox().post(self, setter or self._set_value, value)
+
+    def _set_value(self, value):
+        self.value = value
+
+    # Background #
+    def get_background(self):
+        """ Returns the portion of the parent's rendered background (bg_render) that lies behind the control
+            The slice is cached, and only copied again if the control has moved/resized or the parent has
+            regenerated its background (tracked by the parent's bg_generation counter)
+        """
+        parent = self.GetParent()
+        window_rect = self.GetRect()
+        key = (tuple(window_rect), getattr(parent, 'bg_generation', 0))
+        hit = self._bg_slice is not None and key == self._bg_slice_key
+        if not hit:
+            self._bg_slice = parent.bg_render.GetSubBitmap(window_rect)
+            self._bg_slice_key = key
+        instrument.record_cache(self, 'background', hit)
+        return self._bg_slice
+
+    def invalidate_background(self):
+        """ Discard the cached background slice (and base), it will be copied from the parent at the next paint """
+        self._bg_slice = None
+        self._bg_slice_key = None
+        self._base = None
+        self._base_static = None
+        self._renders.clear()
+
+    def get_base(self, static_layer):
+        """ Returns the background slice with the static layer, (bitmap, position), composed into one bitmap
+            The base is cached, and only composed again if the background slice, the static bitmap (skin) or its
+            position (padding, offset) have changed
+        """
+        static_bmp, position = static_layer
+        background = self.get_background()
+        key = (self._bg_slice_key, tuple(position))
+        hit = self._base is not None and key == self._base_key and static_bmp is self._base_static
+        if not hit:
+            base = background.GetSubBitmap(wx.Rect(background.GetSize()))  # a copy, the slice is left untouched
+            dc = wx.MemoryDC(base)
+            dc.DrawBitmap(static_bmp, position)
+            dc.SelectObject(wx.NullBitmap)
+            self._base = base
+            self._base_key = key
+            self._base_static = static_bmp
+            self._renders.clear()
+        instrument.record_cache(self, 'base', hit)
+        return self._base
+
+    def get_buffered_dc(self, static_layer=None):
+        """ Returns a BufferedPaintDC for the control, already painted with the cached background slice - or if
+            a static layer (bitmap, position) is given, the cached base of background and static layer (get_base)
+            When only part of the control has been invalidated (eg RefreshRect), drawing is clipped to that area
+        """
+        dc = wx.BufferedPaintDC(self)
+        update = self.GetUpdateRegion().GetBox()
+        if update.GetSize() != self.GetClientSize():
+            dc.SetClippingRegion(update)
+        if static_layer is None:
+            dc.DrawBitmap(self.get_background(), 0, 0)
+        else:
+            dc.DrawBitmap(self.get_base(static_layer), 0, 0)
+        return dc
+
+    # Memoized rendering #
+    def get_render(self, state, draw, skin=()):
+        """
+        Returns the control's complete image for state; the background slice with draw(dc) drawn over it
+        For controls with a small, finite set of looks - each image is composed once per (state, focus highlight)
+        and kept until the background, base or skin changes; least recently used images are discarded once they
+        exceed the control's byte budget (renders_max_bytes)
+
+        :param state:   hashable - everything, other than the skin, that the control's look depends on
+        :param draw:    callable - draw(dc) draws the control (without its background) into dc
+        :param skin:    iterable - the bitmaps the control is drawn from; the images are discarded if any is replaced
+        """
+        background = self.get_background()
+        skin = tuple(skin)
+        if (self._renders_key != self._bg_slice_key or len(skin) != len(self._renders_skin)
+                or any(bmp is not held for bmp, held in zip(skin, self._renders_skin))):
+            self._renders.clear()
+            self._renders_key = self._bg_slice_key
+            self._renders_skin = skin
+
+        key = (state, bool(self.highlight and self.HasFocus()))
+        image = self._renders.get(key)
+        hit = image is not None
+        if hit:
+            self._renders.move_to_end(key)
+        else:
+            image = background.GetSubBitmap(wx.Rect(background.GetSize()))
+            dc = wx.MemoryDC(image)
+            draw(dc)
+            dc.SelectObject(wx.NullBitmap)
+            self._renders[key] = image
+            self._evict_renders(image)
+        instrument.record_cache(self, 'render', hit)
+        return image
+
+    def _evict_renders(self, image):
+        if self.renders_max_bytes is None:
+            return
+        w, h = image.GetSize()
+        while len(self._renders) > 1 and len(self._renders) * w * h * 4 > self.renders_max_bytes:
+            self._renders.popitem(last=False)
+
+    def paint_render(self, state, draw, skin=()):
+        """ Paint the control from its memoized image for state (see get_render) - for use in a paint handler
+            The image is complete, so a plain PaintDC is sufficient - there is a single blit to screen
+        """
+        dc = wx.PaintDC(self)
+        dc.DrawBitmap(self.get_render(state, draw, skin), 0, 0)
+
     # TODO make highlight an object that can be attached to any window, each with it's own parameters
     def draw_highlight(self, context, size, adjustment):
         """ Draw a highlighting square around the control """
-        try:
-            dc = wx.GCDC(context)
-        except NotImplementedError:
-            dc = context
-
-        offset = adjustment[0]
-        sizing = adjustment[1]
-        c_r, c_g, c_b, c_a = wx.SystemSettings.GetColour(wx.SYS_COLOUR_HIGHLIGHT)
-        for RGBA, width, i_offset, rect, cnr_rad in [
-            # ((40, 255, 40, 28), 2, (0, 0), self.Rect.Deflate(sizing), 8),
-            # ((35, 142, 35, 10), 3, (1, 1), self.Rect.Deflate(sizing[0] + 1, sizing[1] + 1), 8),
-            # ((0, 22, 0, 88), 1, (2, 2), self.Rect.Deflate(sizing[0] + 2, sizing[1] + 2), 8)
-            ((c_r, c_g, c_b, c_a - 200), 1, (0, 0), wx.Rect((0, 0), size).Deflate(sizing), 4),
-            ((c_r, c_g, c_b, c_a - 220), 1, (1, 1), wx.Rect((0, 0), size).Deflate(sizing[0] + 1, sizing[1] + 1), 4)
-        ]:
-            r, g, b, a = RGBA
-            pen_col = wx.Colour(r, g, b, a)
-            brush_col = wx.TRANSPARENT_BRUSH
-            dc.SetPen(wx.Pen(pen_col, width=width))
-            dc.SetBrush(wx.Brush(brush_col))
-            rect.SetPosition(wx.Point(offset) + wx.Point(i_offset) + wx.Point(sizing))
-            dc.DrawRoundedRectangle(rect, cnr_rad)
+        draw_highlight(context, size, adjustment)
+
+    def animate(self, key, start, end, duration, setter, easing=linear, on_done=None):
+        """ Run a non-blocking tween on the shared animator (see aic.util.animation.Animator.animate) """
+        def done():
+            if on_done:
+                on_done()
+            self._on_animation_end()
+        get_animator().animate(self, key, start, end, duration, setter, easing, done)
+
+    def stop_animation(self, key=None):
+        """ Interrupt the control's tween identified by key, or all of its tweens if key is None """
+        get_animator().cancel(self, key)
+        self._on_animation_end()
+
+    def _on_animation_end(self):
+        if self._evt_policy == EVENT_ON_RELEASE and not self._pressed and not self.is_animating():
+            self.flush_events()
+
+    def is_animating(self, key=None):
+        return get_animator().is_animating(self, key)
+
+    # Input coalescing #
+    def queue_input(self, key, callback):
+        """ Run callback at the next frame of the shared clock; if more input arrives for the same key before then,
+            only the latest callback is run - so handling costs are bounded by display rate, not input rate
+        """
+        get_animator().schedule(self, key, callback)
+
+    def flush_input(self, key=None):
+        """ Process queued input for key (or all queued input if key is None) now, rather than at the next frame """
+        get_animator().flush(self, key)
+
+    def queue_wheel(self, event, handler):
+        """ Accumulate scroll-wheel rotation; handler(rotation, delta) is called once per frame with the total """
+        self._wheel_rotation += event.GetWheelRotation()
+        self._wheel_delta = event.GetWheelDelta() or 120  # usually 120, but it's better not to assume
+        self.queue_input('wheel', lambda: self._flush_wheel(handler))
+
+    def _flush_wheel(self, handler):
+        rotation, self._wheel_rotation = self._wheel_rotation, 0
+        if rotation:
+            handler(rotation, self._wheel_delta)
 
     def set_highlighting(self, highlight=True):
         """ Enable active control highlighting """
@@ -65,4 +348,36 @@ def rect_centre(size, origin=(0, 0)):
     size_x, size_y = size
     centre_x = (size_x - origin_x) // 2
     centre_y = (size_y - origin_y) // 2
-    return wx.Point(centre_x, centre_y)
\ No newline at end of file
+    return wx.Point(centre_x, centre_y)
+
+
+def draw_highlight(context, size, adjustment):
+    """
+    Draw a highlighting square, the focus indicator of the controls
+
+    :param context: the DC to draw on
+    :param size: wx.Size of the highlighted area
+    :param adjustment: ((x, y), (dx, dy)) - offset of the area on context and the amount it's deflated by
+    """
+    try:
+        dc = wx.GCDC(context)
+    except NotImplementedError:
+        dc = context
+
+    offset = adjustment[0]
+    sizing = adjustment[1]
+    c_r, c_g, c_b, c_a = wx.SystemSettings.GetColour(wx.SYS_COLOUR_HIGHLIGHT)
+    for RGBA, width, i_offset, rect, cnr_rad in [
+        # ((40, 255, 40, 28), 2, (0, 0), self.Rect.Deflate(sizing), 8),
+        # ((35, 142, 35, 10), 3, (1, 1), self.Rect.Deflate(sizing[0] + 1, sizing[1] + 1), 8),
+        # ((0, 22, 0, 88), 1, (2, 2), self.Rect.Deflate(sizing[0] + 2, sizing[1] + 2), 8)
+        ((c_r, c_g, c_b, c_a - 200), 1, (0, 0), wx.Rect((0, 0), size).Deflate(sizing), 4),
+        ((c_r, c_g, c_b, c_a - 220), 1, (1, 1), wx.Rect((0, 0), size).Deflate(sizing[0] + 1, sizing[1] + 1), 4)
+    ]:
+        r, g, b, a = RGBA
+        pen_col = wx.Colour(r, g, b, a)
+        brush_col = wx.TRANSPARENT_BRUSH
+        dc.SetPen(wx.Pen(pen_col, width=width))
+        dc.SetBrush(wx.Brush(brush_col))
+        rect.SetPosition(wx.Point(offset) + wx.Point(i_offset) + wx.Point(sizing))
+        dc.DrawRoundedRectangle(rect, cnr_rad)
@@ -0,0 +1,150 @@
+"""
+Sprite atlases - a skin's images packed into a single image file, with a JSON index
+
+Build an atlas from a directory of PNGs (eg res/):
+    python -m aic.atlas res res/skin_atlas.png
+which writes res/skin_atlas.png and res/skin_atlas.json (name -> [x, y, width, height])
+
+At runtime the atlas image is read and decoded once, and each control's bitmap is a sub-bitmap of it:
+    atlas = load_atlas(os.path.join(RESOURCES, 'skin_atlas.json'))
+    knob = RotaryDial(panel, (atlas.bitmap('sticky_knob1a.png'), atlas.bitmap('sticky_knob1a_handle.png')))
+"""
+
+import argparse
+import json
+import math
+import os
+
+import wx
+
+from .resources import load_bitmap
+
+__all__ = ['SpriteAtlas', 'load_atlas', 'pack_rects', 'build_atlas']
+
+_atlases = {}  # shared atlases -> {normalised index path: SpriteAtlas}
+
+
+class SpriteAtlas:
+    """
+    The sprites of a packed atlas image
+
+    :param image_path:  path of the atlas image
+    :param sprites:     dict - {name: (x, y, width, height)}
+    """
+
+    def __init__(self, image_path, sprites):
+        self.image = load_bitmap(image_path)
+        self.sprites = {name: wx.Rect(*rect) for name, rect in sprites.items()}
+        self._bitmaps = {}
+
+    def bitmap(self, name):
+        """ Returns the sprite name as a bitmap; each sprite is cut from the atlas once, on first use """
+        bmp = self._bitmaps.get(name)
+        if bmp is None:
+            try:
+                rect = self.sprites[name]
+            except KeyError:
+                raise KeyError(f'No sprite named {name!r} in the atlas') from None
+            bmp = self._bitmaps[name] = self.image.GetSubBitmap(rect)
+        return bmp
+
+    def __contains__(self, name):
+        return name in self.sprites
+
+    def names(self):
+        return list(self.sprites)
+
+
+def load_atlas(index_path):
+    """ Returns the shared SpriteAtlas described by the JSON index at index_path """
+    key = os.path.normcase(os.path.realpath(index_path))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        with open(key) as file:
+            index = json.load(file)
+        image_path = os.path.join(os.path.dirname(key), index['image'])
+        atlas = _atlases[key] = SpriteAtlas(image_path, index['sprites'])
+    return atlas
+
+
+def pack_rects(sizes, padding=1, max_width=None):
+    """
+    Shelf-pack rectangles, tallest first, into rows no wider than max_width
+    (by default the wider of the widest rectangle and the square root of the total area)
+
+    :param sizes:   dict - {name: (width, height)}
+    :param padding: Int - pixels left clear around each rectangle
+    :return:        ({name: (x, y, width, height)}, (atlas width, atlas height))
+    """
+    if not sizes:
+        return {}, (0, 0)
+    if max_width is None:
+        area = sum((w + padding) * (h + padding) for w, h in sizes.values())
+        max_width = max(max(w for w, _ in sizes.values()) + padding * 2, int(math.ceil(math.sqrt(area))))
+
+    placed = {}
+    x = y = padding
+    shelf_height = 0
+    atlas_width = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        if x + w + padding > max_width and x > padding:
+            y += shelf_height + padding
+            x = padding
+            shelf_height = 0
+        placed[name] = (x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+        atlas_width = max(atlas_width, x)
+    return placed, (atlas_width, y + shelf_height + padding)
+
+
+def build_atlas(source_dir, atlas_path, pattern='.png', padding=1):
+    """
+    Pack every image in source_dir (with a name ending in pattern) into the image atlas_path,
+    writing the JSON index alongside it (same name, .json); the atlas image itself is skipped if it's in source_dir
+
+    :return: the index (dict) written
+    """
+    atlas_name = os.path.basename(atlas_path)
+    images = {}
+    for name in sorted(os.listdir(source_dir)):
+        if not name.endswith(pattern) or name == atlas_name:
+            continue
+        image = wx.Image(os.path.join(source_dir, name))
+        if not image.IsOk():
+            continue
+        if not image.HasAlpha():
+            image.InitAlpha()  # any mask is converted to alpha
+        images[name] = image
+
+    sprites, (width, height) = pack_rects({name: tuple(image.GetSize()) for name, image in images.items()}, padding)
+
+    atlas = wx.Image(max(width, 1), max(height, 1))
+    atlas.SetAlpha(bytearray(max(width, 1) * max(height, 1)))  # fully transparent
+    for name, (x, y, _, _) in sprites.items():
+        atlas.Paste(images[name], x, y)
+    atlas.SaveFile(atlas_path, wx.BITMAP_TYPE_PNG)
+
+    index = {'image': atlas_name, 'size': [width, height],
+             'sprites': {name: list(rect) for name, rect in sorted(sprites.items())}}
+    with open(os.path.splitext(atlas_path)[0] + '.json', 'w') as file:
+        json.dump(index, file, indent=2)
+        file.write('\n')
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m aic.atlas', description='Pack a directory of images into an atlas')
+    parser.add_argument('source', help='directory holding the images (eg res)')
+    parser.add_argument('atlas', help='atlas image to write (eg res/skin_atlas.png); the index is written alongside')
+    parser.add_argument('--pattern', default='.png', help='only pack files ending with this text (default .png)')
+    parser.add_argument('--padding', type=int, default=1, help='pixels left clear around each image (default 1)')
+    args = parser.parse_args(argv)
+
+    app = wx.App(False)  # the image handlers are initialised with the app
+    index = build_atlas(args.source, args.atlas, args.pattern, args.padding)
+    print(f"{len(index['sprites'])} images packed into {args.atlas} ({index['size'][0]} x {index['size'][1]})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,373 @@
+"""
+Headless paint benchmarks for the Active Image Controls
+
+Each control is drawn into a wx.MemoryDC many times through its DC-agnostic draw method (draw_to_context,
+paint_array, paint_matrix or paint_single), changing the control's state every frame. Per-frame paint times
+(percentiles, mean, max), throughput and Python allocations are reported as JSON, so builds can be compared
+Where changing the state has a cost of its own (eg LedMatrix.value), it is made outside the timed paint and
+reported separately as update_mean_us / update_p50_us (allocation figures include it)
+
+On a machine without a display, run under Xvfb:
+    xvfb-run -a python -m aic.bench --frames 2000 --output bench.json
+
+The cold-start cost of importing the package (after wx itself) is measured in fresh interpreters with:
+    python -m aic.bench --imports
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import wx
+
+from aic import ImageControlPanel, LedSingle, LedArray, LedMatrix, RotaryDial, RotarySwitch
+from aic import SimpleSlider, SimpleSlideSwitch, RangeSlider, ToggleSwitch, MomentSwitch
+from aic.util import HAS_NUMPY, clear_rotation_caches, clear_sprite_cache
+
+PANEL_SIZE = (1920, 1080)
+
+
+# Synthetic skins - the benchmarks don't depend on the contents of res/ #
+def _bitmap(size, colour):
+    w, h = size
+    return wx.Bitmap.FromRGBA(w, h, *colour)
+
+
+def _pointer(size):
+    """ a square bitmap with a transparent surround and an opaque pointer bar - representative for rotation """
+    bmp = wx.Bitmap.FromRGBA(size, size, 0, 0, 0, 0)
+    dc = wx.MemoryDC(bmp)
+    gc = wx.GCDC(dc)
+    gc.SetPen(wx.TRANSPARENT_PEN)
+    gc.SetBrush(wx.Brush(wx.Colour(220, 220, 220, 255)))
+    gc.DrawRectangle(size // 2 - 2, 2, 4, size // 2)
+    del gc
+    dc.SelectObject(wx.NullBitmap)
+    return bmp
+
+
+def _led_pair(size=(12, 8)):
+    return _bitmap(size, (0, 0, 0, 120)), _bitmap(size, (255, 255, 255, 60))
+
+
+# Benchmarks #
+# Each factory is passed the panel and config, and returns (control, draw) where draw(dc, frame) paints one frame
+# or (control, draw, update) where update(frame) sets the state for the frame, outside the timed paint
+
+def bench_led_single(panel, config):
+    led = LedSingle(panel, _led_pair())
+
+    def draw(dc, frame):
+        led.stat_bmp = led.bmp_pair[frame & 1]
+        led.paint_single(dc)
+    return led, draw
+
+
+def bench_led_array(panel, config):
+    elements = config['elements']
+    array = LedArray(panel, _led_pair(), [wx.Colour(25, 225, 25, 200)] * elements)
+
+    def draw(dc, frame):
+        array._state = frame % (elements + 1)
+        array.paint_array(dc)
+    return array, draw
+
+
+def bench_led_matrix(panel, config):
+    rows, columns = config['dimension']
+    matrix = LedMatrix(panel, _led_pair((6, 4)), (rows, columns))
+    if config['backend'] == 'numpy':
+        matrix.set_numpy_backend()
+
+    def update(frame):
+        matrix.value = [(frame + column) % (rows + 1) for column in range(columns)]
+
+    def draw(dc, frame):
+        matrix.paint_matrix(dc)
+    return matrix, draw, update
+
+
+def _rotary(control_class, panel, config):
+    control = control_class(panel, (_bitmap((64, 64), (60, 60, 60, 255)), _pointer(50)))
+    if config.get('mode') == 'uncached':
+        control.set_rotation_cache(max_bytes=0)  # a single frame is retained, so a sweep is never served from cache
+    elif config.get('mode') == 'populated':
+        control.set_rotation_cache(populate=True)
+    elif config.get('mode') == 'filmstrip':
+        strip = wx.Bitmap(50, 50 * 128)
+        control.set_filmstrip(strip, 128)
+    step = config['angle_step']
+
+    def draw(dc, frame):
+        control._pointer_angle = (frame * step) % 360
+        control.draw_to_context(dc)
+    return control, draw
+
+
+def bench_rotary_dial(panel, config):
+    return _rotary(RotaryDial, panel, config)
+
+
+def bench_rotary_switch(panel, config):
+    return _rotary(RotarySwitch, panel, config)
+
+
+def bench_simple_slider(panel, config):
+    slider = SimpleSlider(panel, (_bitmap((200, 24), (60, 60, 60, 255)), _bitmap((16, 24), (200, 200, 200, 255))))
+
+    def draw(dc, frame):
+        slider._handle_pos = frame % slider._handle_max_pos
+        slider.draw_to_context(dc)
+    return slider, draw
+
+
+def bench_simple_slide_switch(panel, config):
+    switch = SimpleSlideSwitch(panel, (_bitmap((80, 24), (60, 60, 60, 255)), _bitmap((16, 24), (200, 200, 200, 255))),
+                               switch_ticks=4)
+
+    def draw(dc, frame):
+        switch._handle_pos = switch._ticklist[frame % len(switch._ticklist)]
+        switch.draw_to_context(dc)
+    return switch, draw
+
+
+def bench_range_slider(panel, config):
+    slider = RangeSlider(panel, (_bitmap((200, 24), (60, 60, 60, 255)), _bitmap((12, 24), (200, 200, 200, 255))))
+    slider.range_bar = config['range_bar']
+
+    def draw(dc, frame):
+        max_pos = slider._handle_max_pos
+        slider._handle_pos = [frame % (max_pos // 2), max_pos // 2 + frame % (max_pos // 2)]
+        slider.draw_to_context(dc)
+    return slider, draw
+
+
+def _two_state(control_class, panel, config):
+    control = control_class(panel, (_bitmap((48, 24), (60, 60, 60, 255)), _bitmap((48, 24), (200, 200, 200, 255))))
+
+    def draw(dc, frame):
+        control.stat_bmp = control.bmp_pair[frame & 1]
+        control.draw_to_context(dc)
+    return control, draw
+
+
+def bench_toggle_switch(panel, config):
+    return _two_state(ToggleSwitch, panel, config)
+
+
+def bench_moment_switch(panel, config):
+    return _two_state(MomentSwitch, panel, config)
+
+
+def bench_panel_background(panel, config):
+    panel.tiled_bg = config['tiled']
+    panel.bg_bitmap = _bitmap(config['tile'], (40, 40, 40, 255))
+
+    def draw(dc, frame):
+        panel.render_background()
+        dc.DrawBitmap(panel.bg_render, 0, 0)
+    return panel, draw
+
+
+BENCHMARKS = [
+    ('LedSingle', bench_led_single, [{}]),
+    ('LedArray', bench_led_array, [{'elements': 8}, {'elements': 64}]),
+    ('LedMatrix', bench_led_matrix,
+     [{'dimension': dim, 'backend': backend}
+      for dim in ((8, 8), (32, 64), (64, 128))
+      for backend in (('cells', 'numpy') if HAS_NUMPY else ('cells',))]),
+    ('RotaryDial', bench_rotary_dial,
+     [{'mode': mode, 'angle_step': 1.5} for mode in ('uncached', 'cached', 'populated', 'filmstrip')]),
+    ('RotarySwitch', bench_rotary_switch, [{'mode': mode, 'angle_step': 1.5} for mode in ('uncached', 'cached')]),
+    ('SimpleSlider', bench_simple_slider, [{}]),
+    ('SimpleSlideSwitch', bench_simple_slide_switch, [{}]),
+    ('RangeSlider', bench_range_slider, [{'range_bar': 0}, {'range_bar': 1}]),
+    ('ToggleSwitch', bench_toggle_switch, [{}]),
+    ('MomentSwitch', bench_moment_switch, [{}]),
+    ('ImageControlPanel', bench_panel_background,
+     [{'tiled': tiled, 'tile': tile} for tiled in (False, True) for tile in ((32, 32), (256, 256))]),
+]
+
+
+# Each import scenario is timed in a fresh interpreter, with wx already imported - wx is a fixed cost for any app
+IMPORT_SCENARIOS = [
+    ('package', 'import aic'),
+    ('LedSingle', 'from aic import LedSingle'),
+    ('RotaryDial', 'from aic import RotaryDial'),
+    ('LedMatrix', 'from aic import LedMatrix'),
+    ('everything', 'from aic import *'),
+]
+
+_IMPORT_PROBE = """
+import sys, time
+import wx
+before = len(sys.modules)
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start, len(sys.modules) - before)
+"""
+
+
+# Measurement #
+def _percentile(ordered, percent):
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(draw, frames, size, update=None, warmup=20):
+    """ Paint frames into a MemoryDC, returning the timing and allocation statistics
+        update(frame), if given, is called before each paint and timed separately
+    """
+    target = wx.Bitmap(*size)
+    dc = wx.MemoryDC(target)
+    for frame in range(warmup):
+        if update:
+            update(frame)
+        draw(dc, frame)
+
+    times = []
+    update_times = []
+    elapsed = 0.0
+    for frame in range(frames):
+        if update:
+            start = time.perf_counter()
+            update(frame)
+            update_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        draw(dc, frame)
+        times.append(time.perf_counter() - start)
+        elapsed += times[-1]
+
+    # allocations are traced on a separate (shorter) run, as tracing distorts the timings
+    alloc_frames = max(1, min(frames, 200))
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for frame in range(alloc_frames):
+        if update:
+            update(frame)
+        draw(dc, frame)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    allocated = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    allocations = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    dc.SelectObject(wx.NullBitmap)
+
+    ordered = sorted(times)
+    to_us = 1e6
+    result = {
+        'frames': frames,
+        'mean_us': round(sum(times) / frames * to_us, 2),
+        'p50_us': round(_percentile(ordered, 50) * to_us, 2),
+        'p90_us': round(_percentile(ordered, 90) * to_us, 2),
+        'p99_us': round(_percentile(ordered, 99) * to_us, 2),
+        'max_us': round(ordered[-1] * to_us, 2),
+        'fps': round(frames / elapsed, 1) if elapsed else None,
+        'alloc_bytes_per_frame': round(allocated / alloc_frames, 1),
+        'alloc_blocks_per_frame': round(allocations / alloc_frames, 2),
+        'alloc_peak_bytes': peak,
+    }
+    if update:
+        result['update_mean_us'] = round(sum(update_times) / frames * to_us, 2)
+        result['update_p50_us'] = round(_percentile(sorted(update_times), 50) * to_us, 2)
+    return result
+
+
+def measure_import(statement, runs=10):
+    """ Time statement in runs fresh interpreters, returning the timing and the number of modules it loaded """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # the directory holding the aic package
+    times = []
+    modules = 0
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', _IMPORT_PROBE.format(statement=statement)], cwd=root,
+                                capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+        modules = int(output[1])
+    to_ms = 1e3
+    return {
+        'runs': runs,
+        'median_ms': round(statistics.median(times) * to_ms, 2),
+        'min_ms': round(min(times) * to_ms, 2),
+        'max_ms': round(max(times) * to_ms, 2),
+        'modules_loaded': modules,
+    }
+
+
+def _meta():
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'wx': wx.version(),
+        'platform': platform.platform(),
+        'numpy': HAS_NUMPY,
+    }
+
+
+def run_imports(runs=10, only=None):
+    """ Run the import-time scenarios (or those whose name contains only) and return the results as a dict """
+    results = []
+    for name, statement in IMPORT_SCENARIOS:
+        if only and only.lower() not in name.lower():
+            continue
+        result = {'scenario': name, 'statement': statement}
+        result.update(measure_import(statement, runs))
+        results.append(result)
+    return {'meta': _meta(), 'imports': results}
+
+
+def run(frames=1000, only=None):
+    """ Run every benchmark (or those whose name contains only) and return the results as a dict """
+    app = wx.App(False)
+    frame = wx.Frame(None, size=PANEL_SIZE)
+    results = []
+    for name, factory, configs in BENCHMARKS:
+        if only and only.lower() not in name.lower():
+            continue
+        for config in configs:
+            clear_rotation_caches()
+            clear_sprite_cache()
+            panel = ImageControlPanel(frame, _bitmap((64, 64), (40, 40, 40, 255)), size=PANEL_SIZE)
+            panel.render_background()
+            control, draw, *update = factory(panel, config)
+            size = PANEL_SIZE if control is panel else control.GetBestSize()
+            result = {'control': name, 'config': {k: list(v) if isinstance(v, tuple) else v
+                                                  for k, v in config.items()}}
+            result.update(measure(draw, frames, size, *update))
+            results.append(result)
+            panel.Destroy()
+    frame.Destroy()
+    app.Destroy()
+    return {'meta': _meta(), 'results': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m aic.bench', description='Headless paint benchmarks (JSON output)')
+    parser.add_argument('--frames', type=int, default=1000, help='frames painted per benchmark (default 1000)')
+    parser.add_argument('--only', help='only run benchmarks whose control name contains this text')
+    parser.add_argument('--imports', action='store_true',
+                        help='measure package import times (in fresh interpreters) rather than painting')
+    parser.add_argument('--runs', type=int, default=10, help='interpreters started per import scenario (default 10)')
+    parser.add_argument('--output', help='write the JSON report to this file rather than stdout')
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        report = run_imports(args.runs, args.only)
+    else:
+        report = run(args.frames, args.only)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text + '\n')
+    else:
+        sys.stdout.write(text + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
 import wx
-from .util import dc_to_bitmap
+from .util import dc_to_bitmap, tile_bitmap, instrument
 
 
 class ImageControlFrame(wx.Frame):
@@ -20,6 +20,10 @@ class ImageControlFrame(wx.Frame):
         self._bg_height = 0
         self._bg_render = wx.EmptyBitmap
         self._tiled_bg = tiled
+        self._tiled_render = None   # the last tiled background, reused while the size and colour are unchanged
+        self._tiled_key = None
+        self._bg_has_alpha = False  # alpha properties of the background are analysed once, in set_background
+        self._bg_opaque = True
         # Setting to True is only useful if you are drawing other objects directly onto the Frame - ie. not using Panels
         self.store_render = False
 
@@ -32,6 +36,11 @@ class ImageControlFrame(wx.Frame):
     def _on_erase_background(self, _):
         pass
 
+    def Refresh(self, eraseBackground=True, rect=None):
+        instrument.record_refresh(self)
+        super().Refresh(eraseBackground, rect)
+
+    @instrument.timed_paint
     def on_paint(self, _):
         x, y = 0, 0
         w, h = self.GetSize()
@@ -39,7 +48,7 @@ class ImageControlFrame(wx.Frame):
         dc = wx.AutoBufferedPaintDC(self)
 
         # Draw a background rectangle to prevent corruption when using images that have transparency
-        if self._bg_bitmap.ConvertToImage().HasAlpha():
+        if not self._bg_opaque:
             brush = dc.GetBrush()
             brush.SetColour(dc.GetTextBackground())
             dc.SetBrush(brush)
@@ -47,18 +56,18 @@ class ImageControlFrame(wx.Frame):
 
         # If client size has changed, draw the bg_bitmap, tiling the bitmap if requested
         # If size is unchanged, draw the stored background (self.bg_render)
-        if self._bg_render.GetSize() != self.GetClientSize():
+        stale = self._bg_render.GetSize() != self.GetClientSize()
+        instrument.record_cache(self, 'background', not stale)
+        if stale:
 
             if self._tiled_bg:
-                # Tiled bitmap drawn to Frame
-                columns = (w // self._bg_width) + 1
-                rows = (h // self._bg_height) + 1
-                for row in range(rows):
-                    for col in range(columns):
-                        dc.DrawBitmap(self._bg_bitmap, x, y)
-                        x += self._bg_width
-                    y += self._bg_height
-                    x = 0
+                # Tiled bitmap drawn to Frame - only tiled again if the frame size (or colour) has changed
+                colour = dc.GetTextBackground()
+                key = (w, h, tuple(colour))
+                if self._tiled_render is None or key != self._tiled_key:
+                    self._tiled_render = tile_bitmap(self._bg_bitmap, (w, h), colour)
+                    self._tiled_key = key
+                dc.DrawBitmap(self._tiled_render, x, y)
             else:
                 # Single bitmap drawn to Frame
                 dc.DrawBitmap(self._bg_bitmap, x, y)
@@ -76,6 +85,8 @@ class ImageControlFrame(wx.Frame):
         self._bg_width = self._bg_bitmap.Size.width
         self._bg_height = self._bg_bitmap.Size.height
         self._bg_render = self._bg_bitmap
+        self._tiled_render = None
+        self._analyse_alpha()
         self.set_tiled(tiled)
         self.set_stored(stored)
 
@@ -84,3 +95,28 @@ class ImageControlFrame(wx.Frame):
 
     def set_stored(self, stored=True):
         self.store_render = stored
+
+    def _analyse_alpha(self):
+        """ Inspect the background bitmap once, rather than converting it to an image on every paint """
+        self._bg_has_alpha = False
+        self._bg_opaque = True
+        if not self._bg_bitmap.IsOk():
+            return
+        img = self._bg_bitmap.ConvertToImage()
+        self._bg_has_alpha = img.HasAlpha()
+        if self._bg_has_alpha:
+            alpha = img.GetAlpha()
+            self._bg_opaque = alpha.count(b'\xff') == len(alpha)  # counted in C, not a python loop over the bytes
+        elif img.HasMask():
+            self._bg_opaque = False
+
+    # Properties #
+    @property
+    def bg_has_alpha(self):
+        """ True if the background bitmap has an alpha channel """
+        return self._bg_has_alpha
+
+    @property
+    def bg_is_opaque(self):
+        """ True if every pixel of the background bitmap is fully opaque (no alpha or mask transparency) """
+        return self._bg_opaque
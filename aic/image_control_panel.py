@@ -1,8 +1,9 @@
 import wx
-from .util import dc_to_bitmap
+from .util import tile_bitmap, instrument, GridIndex
+from .util.refresh import RefreshHoldMixin
 
 
-class ImageControlPanel(wx.Panel):
+class ImageControlPanel(RefreshHoldMixin, wx.Panel):
     """
     Build a Panel with a background image, tiling the image if requested
     If the image has alpha values, the window below the Panel will appear to show through
@@ -14,42 +15,152 @@ class ImageControlPanel(wx.Panel):
         self.bg_bitmap = bg_bitmap
         self.tiled_bg = tiled
         self.bg_render = self.bg_bitmap  # instantiated with the passed background image
+        self.bg_generation = 0  # incremented each time bg_render is regenerated; child controls cache against it
+
+        self._windowless = GridIndex()      # windowless controls hosted by the panel, indexed by their rects
+        self._windowless_focus = None       # the windowless control receiving key events
+        self._windowless_capture = None     # the windowless control receiving mouse events while the button is down
+        self._windowless_bound = False      # input handlers are only bound once a windowless control is added
 
         self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
         self.Bind(wx.EVT_PAINT, self.on_paint)
         self.Bind(wx.EVT_SIZE, self.on_size)
 
+    def Refresh(self, eraseBackground=True, rect=None):
+        instrument.record_refresh(self)  # includes controls refreshing the portion of the panel behind them
+        super().Refresh(eraseBackground, rect)
+
     def on_size(self, event):
         self.parent.Refresh()
         event.Skip()  # propagation is important
 
+    @instrument.timed_paint
     def on_paint(self, _):
-        x = y = 0
-        dc = wx.AutoBufferedPaintDC(self)  # wx.PaintDC(self)
-
-        # Draw the background, tiling the image if requested but ONLY IF client size has changed...
+        # Render the background, tiling the image if requested but ONLY IF client size has changed...
         # otherwise draw the background using previously rendered bitmap (self.bg_render)
-        if self.bg_render.GetSize() != self.GetClientSize():
-
-            if self.tiled_bg:
-                w, h = self.GetSize()
-                bg_w = self.bg_bitmap.GetWidth()
-                bg_h = self.bg_bitmap.GetHeight()
-                cols = (w // bg_w) + 1
-                rows = (h // bg_h) + 1
-                # print('tiled Panel painting')
-                for r in range(rows):
-                    for c in range(cols):
-                        dc.DrawBitmap(self.bg_bitmap, x, y)
-                        x += bg_w
-                    y += bg_h
-                    x = 0
-            else:
-                # print('non-tiled Panel painting')
-                dc.DrawBitmap(self.bg_bitmap, x, y)
-
-            self.bg_render = dc_to_bitmap(self, dc)  # Retain the now-rendered background
+        stale = self.bg_render.GetSize() != self.GetClientSize()
+        if stale:
+            self.render_background()
+        instrument.record_cache(self, 'background', not stale)
+
+        if not self._windowless:
+            # bg_render is the panel's back buffer, so a plain PaintDC is sufficient - there is a single blit to screen
+            dc = wx.PaintDC(self)
+            dc.DrawBitmap(self.bg_render, 0, 0)
+            return
+
+        # windowless controls are drawn over the background, in one pass, on the panel's back buffer
+        # only the controls intersecting the invalidated rectangles are drawn
+        region = self.GetUpdateRegion()
+        rects = []
+        iterator = wx.RegionIterator(region)
+        while iterator.HaveRects():
+            rects.append(iterator.GetRect())
+            iterator.Next()
 
+        dc = wx.BufferedPaintDC(self)
+        dc.SetDeviceClippingRegion(region)
+        dc.DrawBitmap(self.bg_render, 0, 0)
+        for control in self.windowless_in(*rects):
+            control.draw(dc)
+
+    def render_background(self):
+        """ Render the background (at client size) directly into a new off-screen bitmap; self.bg_render """
+        width, height = self.GetClientSize()
+        colour = self.GetBackgroundColour()
+
+        if self.tiled_bg:
+            # print('tiled Panel rendering')
+            self.bg_render = tile_bitmap(self.bg_bitmap, (width, height), colour)
         else:
-            # print('drawing Panel background from previous render')
-            dc.DrawBitmap(self.bg_render, x, y)
+            # print('non-tiled Panel rendering')
+            bitmap = wx.Bitmap(max(width, 1), max(height, 1))
+            dc = wx.MemoryDC(bitmap)
+            dc.SetBackground(wx.Brush(colour))
+            dc.Clear()
+            dc.DrawBitmap(self.bg_bitmap, 0, 0, True)
+            dc.SelectObject(wx.NullBitmap)
+            self.bg_render = bitmap
+
+        self.bg_generation += 1
+
+    # Windowless controls #
+    def add_windowless(self, control):
+        """ Host a windowless control (called by WindowlessControl on creation) """
+        if not self._windowless_bound:
+            self.Bind(wx.EVT_MOUSE_EVENTS, self._on_windowless_mouse)
+            self.Bind(wx.EVT_KEY_DOWN, self._on_windowless_key)
+            self.Bind(wx.EVT_SET_FOCUS, self._on_windowless_focus_change)
+            self.Bind(wx.EVT_KILL_FOCUS, self._on_windowless_focus_change)
+            self._windowless_bound = True
+        self._windowless.insert(control, control.rect)
+        self.refresh_windowless(control)
+
+    def remove_windowless(self, control):
+        self._windowless.remove(control)
+        if self._windowless_focus is control:
+            self._windowless_focus = None
+        if self._windowless_capture is control:
+            self._windowless_capture = None
+        self.refresh_windowless(control)
+
+    def move_windowless(self, control, old_rect):
+        """ Update the index and repaint after a windowless control has moved from old_rect
+            (called by WindowlessControl.set_rect)
+        """
+        self._windowless.move(control, control.rect)
+        self.RefreshRect(old_rect, False)
+        self.refresh_windowless(control)
+
+    def refresh_windowless(self, control):
+        self.RefreshRect(control.rect, False)
+
+    def windowless_at(self, point):
+        """ Returns the top-most windowless control at point, or None """
+        for control in self._windowless.at(point):
+            if control.hit_test(point):
+                return control
+        return None
+
+    def windowless_in(self, *rects):
+        """ Returns the windowless controls intersecting any of rects, in paint order """
+        return self._windowless.query(*rects)
+
+    @property
+    def windowless_focus(self):
+        return self._windowless_focus
+
+    def set_windowless_focus(self, control):
+        """ Give a windowless control (or None) the keyboard focus """
+        previous, self._windowless_focus = self._windowless_focus, control
+        if control is not None and not self.HasFocus():
+            self.SetFocusIgnoringChildren()
+        for changed in {previous, control} - {None}:
+            self.refresh_windowless(changed)
+
+    def _on_windowless_mouse(self, event):
+        pos = event.GetPosition()
+        target = self._windowless_capture or self.windowless_at(pos)
+        if event.ButtonDown(wx.MOUSE_BTN_LEFT):
+            self._windowless_capture = target
+            if target is None:
+                self.set_windowless_focus(None)  # a click on the panel itself
+            elif target.accepts_focus():
+                self.set_windowless_focus(target)
+        elif event.ButtonUp(wx.MOUSE_BTN_LEFT) or event.Leaving():
+            self._windowless_capture = None
+        if target is None:
+            event.Skip()
+            return
+        target.on_mouse(event, pos - target.rect.GetTopLeft())
+
+    def _on_windowless_focus_change(self, event):
+        if self._windowless_focus is not None:
+            self.refresh_windowless(self._windowless_focus)  # its highlight follows the panel's focus
+        event.Skip()
+
+    def _on_windowless_key(self, event):
+        if self._windowless_focus is None:
+            event.Skip()
+            return
+        self._windowless_focus.on_key(event)
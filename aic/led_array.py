@@ -1,6 +1,6 @@
 import wx
 from aic import ActiveImageControl
-from .util import dc_to_bitmap
+from .util import get_tinted_sprite, instrument
 
 
 class LedArray(ActiveImageControl):
@@ -64,55 +64,39 @@ class LedArray(ActiveImageControl):
         return False
 
     # Event Handling #
+    @instrument.timed_paint
     def on_paint(self, _):
-        window_rect = self.GetRect()
-        buffer_bitmap = self.parent.bg_render.GetSubBitmap(window_rect)
-        context = wx.BufferedPaintDC(self, buffer_bitmap)
+        context = self.get_buffered_dc()
 
         self.paint_array(context)
 
     # Instance methods #
     def paint_array(self, context):
-        try:
-            dc = wx.GCDC(context)
-        except NotImplementedError:
-            dc = context
-
         w, h = self.stat_size
         px, py = self.stat_padding
 
         for index, colour in enumerate(self.colours):
-            if self.inverted:
-                pen_col = brush_col = colour
-            else:
-                pen_col = brush_col = self.colours[-1 - index]
+            if not self.inverted:
+                colour = self.colours[-1 - index]
 
-            dc.SetPen(wx.Pen(pen_col, width=1))
-            dc.SetBrush(wx.Brush(brush_col))
             if self.vertical:
                 sx, sy = (0, index * (h + self.spacing))  # vertical
             else:
                 sx, sy = (index * (w + self.spacing), 0)  # horizontal
             x = px + sx
             y = py + sy
-            rect = wx.Rect(x, y, w, h)
 
-            # using Deflate to adjust rectangle size
-            dc.DrawRectangle(rect.Deflate(self.colour_shrink))
             if self.bar:
                 if self.inverted:
-                    dc.DrawBitmap(self.bmp_pair[self.value > index], x, y)
+                    state = self.value > index
                 else:
-                    dc.DrawBitmap(self.bmp_pair[self.value >= len(self.colours) - index], x, y)
+                    state = self.value >= len(self.colours) - index
             else:
                 if self.inverted:
-                    dc.DrawBitmap(self.bmp_pair[self.value == index+1], x, y)
+                    state = self.value == index+1
                 else:
-                    dc.DrawBitmap(self.bmp_pair[self.value == len(self.colours) - index], x, y)
-
-        bob = dc_to_bitmap(self, dc)
-        # save_bmp_to_file(bob, 'bbits.png', filetype=wx.BITMAP_TYPE_PNG)
-        return bob
+                    state = self.value == len(self.colours) - index
+            context.DrawBitmap(get_tinted_sprite(self.bmp_pair[state], colour, self.colour_shrink), x, y)
 
     # Getters and Setters #
     def set_padding(self, padding):
@@ -1,6 +1,6 @@
-import time     # todo remove - purely for checking / testing draw times
 import wx
 from aic import ActiveImageControl
+from aic.util import MatrixCompositor, get_tinted_sprite, instrument
 
 
 class LedMatrix(ActiveImageControl):
@@ -14,7 +14,14 @@ class LedMatrix(ActiveImageControl):
                     The  bitmap in (1) position represents the ON state
     :param dimension:   A tuple with the number of elements needed ( rows, columns)
 
-    Note: The whole matrix is redrawn, every time, in one hit - quite fast for a large number of elements
+    The state is held as a 2-D (row-major) bytearray of cells, 0 for OFF and non-zero for ON
+    .value works with a list of column heights (bar graph style), while set_cell, set_row, set_column, set_rect
+    and set_buffer update arbitrary patterns - each call results in a single refresh of the changed area
+
+    Note: Only the cells that change state are invalidated, and painting is limited to the cells within the
+          update region - so a few changing columns on a large matrix only cost a few cells to redraw
+          For very large matrices, set_numpy_backend() composes the whole matrix as one array operation
+          and draws it with a single blit (requires numpy)
     """
 
     def __init__(self, parent, bitmaps, dimension=(1, 1), *args, **kwargs):
@@ -34,7 +41,10 @@ class LedMatrix(ActiveImageControl):
         self.spacing = 1
         self.stat_position = self.GetPosition() + self.stat_padding  # Top left corner of matrix (inside of any padding)
         self.stat_rect = wx.Rect(self.stat_position, self.stat_size)  # Matrix  excluding padding TODO size ? Needed?
-        self._state = [0] * self.columns  # TODO two dimensional array? each column has a value
+        self._state = bytearray(self.rows * self.columns)  # cell states, row-major: index = row * columns + column
+        self._numpy_backend = False
+        self._compositor = None  # MatrixCompositor used by the numpy backend, built on demand
+        self._compositor_key = None
 
         self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
         self.Bind(wx.EVT_PAINT, self.on_paint)
@@ -61,55 +71,214 @@ class LedMatrix(ActiveImageControl):
         return False
 
     # Event Handling #
+    @instrument.timed_paint
     def on_paint(self, _):
-        # start = time.perf_counter()
-        window_rect = self.GetRect()
-        buffer_bitmap = self.parent.bg_render.GetSubBitmap(window_rect)  # the bit of panel bitmap we draw on
-        context = wx.BufferedPaintDC(self, buffer_bitmap)
+        context = self.get_buffered_dc()
 
-        self.paint_matrix(context)
-        # print(time.perf_counter() - start)
+        self.paint_matrix(context, self.GetUpdateRegion())
         # on screen painting only occurs the instance that this method exits
 
     # instance methods #
-    def paint_matrix(self, context):
+    def paint_matrix(self, context, region=None):
+        """ Draw the matrix cells onto context; if a wx.Region is passed only the cells it touches are drawn """
 
-        try:
-            dc = wx.GCDC(context)
-        except NotImplementedError:
-            dc = context
+        if self._numpy_backend:
+            context.DrawBitmap(self._get_compositor().render(self._state_array()), self.stat_padding)
+            return
 
-        pen_col = brush_col = self.bg_colour
-        dc.SetPen(wx.Pen(pen_col, width=1))
-        dc.SetBrush(wx.Brush(brush_col))
+        sprites = [get_tinted_sprite(bmp, self.bg_colour, self.colour_shrink) for bmp in self.bmp_pair]
 
         px, py = self.stat_padding
         w, h = self.stat_bmp.Size
 
-        for column in range(self.columns):
-            for row in range(self.rows):
-                point = px + (column * (w + self.spacing)), py + (row * (h + self.spacing))
-                rect = wx.Rect(point, self.stat_size)
+        for column, row in self._cells_in_region(region):
+            point = px + (column * (w + self.spacing)), py + (row * (h + self.spacing))
+            context.DrawBitmap(sprites[self._state[row * self.columns + column] != 0], point)
+
+    def _get_compositor(self):
+        """ Returns the MatrixCompositor, rebuilding its sprites if the bitmaps or colour settings have changed """
+        key = (id(self.bmp_pair[0]), id(self.bmp_pair[1]), tuple(self.bg_colour.Get(includeAlpha=True)),
+               self.colour_shrink, self.spacing)
+        if key != self._compositor_key:
+            self._compositor = MatrixCompositor(self.bmp_pair, self.bg_colour, self.colour_shrink, self.spacing)
+            self._compositor_key = key
+        return self._compositor
+
+    def _state_array(self):
+        """ Returns a 2-D (rows, columns) view of the cell states - no copy is made """
+        return memoryview(self._state).cast('B', (self.rows, self.columns))
 
-                col_val = self.value[column]
-                # using Deflate to correct for the extra line width added by DrawRectangle
-                # if col_val >= self.rows - row:    # Use this method if only drawing rects (not bmps)
-                #     dc.DrawRectangle(rect.Deflate(self.colour_shrink))
-                dc.DrawRectangle(rect.Deflate(self.colour_shrink))
-                dc.DrawBitmap(self.bmp_pair[col_val >= self.rows - row], point)
+    def _cells_in_region(self, region=None):
+        """ Returns a list of (column, row) for each cell that intersects region (all cells if region is None) """
+        if region is None or region.IsEmpty():
+            return [(column, row) for column in range(self.columns) for row in range(self.rows)]
+
+        px, py = self.stat_padding
+        w, h = self.stat_size
+        step_x, step_y = w + self.spacing, h + self.spacing
+        cells = set()
+        iterator = wx.RegionIterator(region)
+        while iterator.HaveRects():
+            rect = iterator.GetRect()
+            col_first = max(0, (rect.x - px) // step_x)
+            col_last = min(self.columns - 1, (rect.x + rect.width - 1 - px) // step_x)
+            row_first = max(0, (rect.y - py) // step_y)
+            row_last = min(self.rows - 1, (rect.y + rect.height - 1 - py) // step_y)
+            for column in range(col_first, col_last + 1):
+                for row in range(row_first, row_last + 1):
+                    cells.add((column, row))
+            iterator.Next()
+        return sorted(cells)
+
+    def _cells_rect(self, row, column, height=1, width=1):
+        """ Returns the rectangle covering a block of cells (height rows by width columns) """
+        px, py = self.stat_padding
+        w, h = self.stat_size
+        x = px + (column * (w + self.spacing))
+        y = py + (row * (h + self.spacing))
+        return wx.Rect(x, y, width * (w + self.spacing), height * (h + self.spacing))
+
+    def _write_cells(self, target, values):
+        """ Write values into the slice target of the state; returns True if any cell has changed """
+        if self._state[target] == values:
+            return False
+        self._state[target] = values
+        return True
+
+    def _refresh_difference(self, previous):
+        """ Refresh, in each column, the span of cells that differ between previous and the current state
+            (wx merges the rectangles into a single paint)
+        """
+        rows, columns = self.rows, self.columns
+        for column in range(columns):
+            new, old = self._state[column::columns], previous[column::columns]
+            if new != old:
+                changed = [row for row in range(rows) if new[row] != old[row]]
+                row_first, row_last = changed[0], changed[-1]
+                self.RefreshRect(self._cells_rect(row_first, column, row_last - row_first + 1, 1), False)
+
+    @staticmethod
+    def _as_buffer(values):
+        """ Returns values as a flat byte buffer, one byte per cell
+            Contiguous buffers of single byte items (bytes, bytearray, array('B'), uint8 / bool numpy arrays) are
+            not copied; any other values (wider array items, lists...) are converted - each to 1 if true, else 0
+        """
+        try:
+            view = memoryview(values)
+        except TypeError:
+            return bytes(bool(value) for value in values)  # an iterable of ints / bools
+        if view.itemsize == 1 and view.c_contiguous:
+            if view.format != 'B' or view.ndim != 1:
+                view = view.cast('B')
+            return view
+        flat = view.tolist()
+        while flat and isinstance(flat[0], list):  # a multi-dimensional buffer
+            flat = [value for row in flat for value in row]
+        return bytes(bool(value) for value in flat)
+
+    def _validate_length(self, values, length):
+        if len(values) != length:
+            raise ValueError(f'Expected {length} values, received {len(values)}')
+
+    def _validate_row(self, row):
+        if not 0 <= row < self.rows:
+            raise IndexError(f'row {row} is outside the matrix (0 - {self.rows - 1})')
+
+    def _validate_column(self, column):
+        if not 0 <= column < self.columns:
+            raise IndexError(f'column {column} is outside the matrix (0 - {self.columns - 1})')
 
     # Getters and Setters #
+    def set_cell(self, row, column, state):
+        """ Set the state of a single cell """
+        self._validate_row(row)
+        self._validate_column(column)
+        index = row * self.columns + column
+        if self._write_cells(slice(index, index + 1), bytes((bool(state),))):
+            self.RefreshRect(self._cells_rect(row, column), False)
+
+    def set_row(self, row, values):
+        """ Set every cell of a row from an iterable / buffer of (columns) values """
+        self._validate_row(row)
+        values = self._as_buffer(values)
+        self._validate_length(values, self.columns)
+        start = row * self.columns
+        if self._write_cells(slice(start, start + self.columns), values):
+            self.RefreshRect(self._cells_rect(row, 0, 1, self.columns), False)
+
+    def set_column(self, column, values):
+        """ Set every cell of a column (top to bottom) from an iterable / buffer of (rows) values """
+        self._validate_column(column)
+        values = self._as_buffer(values)
+        self._validate_length(values, self.rows)
+        if self._write_cells(slice(column, None, self.columns), values):
+            self.RefreshRect(self._cells_rect(0, column, self.rows, 1), False)
+
+    def set_rect(self, row, column, values, width):
+        """ Set a block of cells, with its top left cell at (row, column), from a flat (row-major) iterable / buffer
+            of values; width is the number of columns in the block, the number of rows is inferred
+        """
+        values = self._as_buffer(values)
+        height = len(values) // width if width else 0
+        if not (0 < width and 0 <= column and column + width <= self.columns
+                and 0 <= row and row + height <= self.rows):
+            raise ValueError('The block does not fit within the matrix')
+        self._validate_length(values, width * height)
+        changed = False
+        for r in range(height):
+            start = (row + r) * self.columns + column
+            changed |= self._write_cells(slice(start, start + width), values[r * width:(r + 1) * width])
+        if changed:
+            self.RefreshRect(self._cells_rect(row, column, height, width), False)
+
+    def set_buffer(self, values):
+        """ Set every cell from a flat (row-major) iterable / buffer of (rows * columns) values
+            Only the area bounding the changed cells is refreshed
+        """
+        values = self._as_buffer(values)
+        self._validate_length(values, self.rows * self.columns)
+        previous = bytes(self._state)
+        if self._write_cells(slice(None), values):
+            self._refresh_difference(previous)
+
     def set_padding(self, padding):
         self.stat_padding = padding
 
+    def set_numpy_backend(self, enabled=True):
+        """ Compose the matrix with numpy and draw it in a single blit, instead of drawing each cell """
+        self._numpy_backend = enabled
+        self._compositor = None
+        self._compositor_key = None
+        if enabled:
+            self._get_compositor()  # raises ImportError now, rather than at paint time, if numpy is missing
+        self.Refresh(False)
+
     # Properties #
     @property
     def value(self):
-        return self._state
+        """ The height of each column, read back from the cells - ie the number of ON cells in the column
+            (not necessarily the values last set: heights are truncated to whole cells, clamped to 0 - rows and
+            cells may also have been set individually)
+        """
+        columns = self.columns
+        return [sum(1 for cell in self._state[column::columns] if cell) for column in range(columns)]
 
     @value.setter
     def value(self, state):
-        if state != self._state:
-            self._state = state
-            self.parent.Refresh(True, self.GetRect())
+        """ Display a bar graph; state is an iterable with a height value (int or float) for each column
+            A column lights the cells its height fully covers, eg 2.5 lights 2 cells
+        """
+        rows, columns = self.rows, self.columns
+        state = list(state)
+        self._validate_length(state, columns)
+        cells = bytearray(rows * columns)
+        for column, height in enumerate(state):
+            lit = min(rows, max(0, int(height)))
+            cells[(rows - lit) * columns + column::columns] = b'\x01' * lit
+        self.set_buffer(cells)
+
+    @property
+    def cells(self):
+        """ A read-only 2-D (rows, columns) view of the cell states """
+        return self._state_array().toreadonly()
 
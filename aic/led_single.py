@@ -1,5 +1,6 @@
 import wx
 from aic import ActiveImageControl
+from aic.util import get_tinted_sprite, instrument
 
 
 class LedSingle(ActiveImageControl):
@@ -52,30 +53,16 @@ class LedSingle(ActiveImageControl):
         return False
 
     # Event Handling #
+    @instrument.timed_paint
     def on_paint(self, _):
-        window_rect = self.GetRect()
-        buffer_bitmap = self.parent.bg_render.GetSubBitmap(window_rect)
-        context = wx.BufferedPaintDC(self, buffer_bitmap)
-
-        self.paint_single(context)
+        state = (self._state, tuple(self.bg_colour), self.colour_shrink, tuple(self.stat_padding))
+        self.paint_render(state, self.paint_single, self.bmp_pair)
 
     # instance methods #
 
     def paint_single(self, context):
-
-        try:
-            dc = wx.GCDC(context)
-        except NotImplementedError:
-            dc = context
-
-        pen_col = brush_col = self.bg_colour
-        dc.SetPen(wx.Pen(pen_col, width=1))
-        dc.SetBrush(wx.Brush(brush_col))
-        rect = wx.Rect(self.stat_padding, self.stat_size)
-
-        # using Deflate to correct for the extra line width added by DrawRectangle
-        dc.DrawRectangle(rect.Deflate(self.colour_shrink))
-        dc.DrawBitmap(self.stat_bmp, self.stat_padding)
+        sprite = get_tinted_sprite(self.stat_bmp, self.bg_colour, self.colour_shrink)
+        context.DrawBitmap(sprite, self.stat_padding)
 
     def toggle_state(self):
         self._state = not self._state
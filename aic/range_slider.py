@@ -1,10 +1,7 @@
-import time
-
 import wx
 from wx.lib.newevent import NewCommandEvent
-import pytweening as ptw
 from aic import ActiveImageControl
-from aic.util import make_padding
+from aic.util import make_padding, get_easing, instrument
 
 rs_cmd_event, EVT_RS_CHANGE = NewCommandEvent()
 
@@ -67,8 +64,10 @@ class RangeSlider(ActiveImageControl):
         self._not_dragging = True
         self._last_mouse_pos = None
         self._evt_on_focus = False
-        # self._evt_on_animate = True   # enable when threaded animation is used;
+        # self._evt_on_animate = True
         # Used to generate an event for each step of the animation (currently sends event at completion of animation)
+        self.animation_duration = 0.25  # seconds for a handle to travel the full length of the axis
+        self.animation_easing = get_easing('easeOutQuart')
 
         self.highlight_box = ((0, 0), (0, 0))
 
@@ -93,13 +92,17 @@ class RangeSlider(ActiveImageControl):
         return size
 
     # Event handling #
+    @instrument.timed_paint
     def on_paint(self, _):
-        window_rect = self.GetRect()
-        buffer_bitmap = self.parent.bg_render.GetSubBitmap(window_rect)
-        self.draw_to_context(wx.BufferedPaintDC(self, buffer_bitmap))
+        self.draw_to_context(self.get_buffered_dc(self.static_layer), static=False)
+
+    @property
+    def static_layer(self):
+        return self.stat_bmp, self._static_pos
 
-    def draw_to_context(self, dc):
-        dc.DrawBitmap(self.stat_bmp, self._static_pos)  # Draws foundation image
+    def draw_to_context(self, dc, static=True):
+        if static:
+            dc.DrawBitmap(self.stat_bmp, self._static_pos)  # Draws foundation image
         hi_point = self.get_handle_point(self._handle_pos[1], True)
         lo_point = self.get_handle_point(self._handle_pos[0])
         if self.range_bar:
@@ -201,29 +204,33 @@ class RangeSlider(ActiveImageControl):
         rel_mouse_pos = mouse_pos[index] - self._handle_offset[index] - \
                         self._static_padding[3 - (3 * index)] - self._handle_size[0][index]
         self._active_handle = self._closest_handle(rel_mouse_pos)
+        self.queue_wheel(event, self._wheel_move)
 
-        delta = event.GetWheelDelta()  # normally +/-120, but better not to assume
+    def _wheel_move(self, rotation, delta):
         if (self.inverted and not self.vertical) or (self.vertical and not self.inverted):
             self.set_position(
-                self._handle_pos[self._active_handle] - (self._scroll_wheel_step * event.GetWheelRotation() // delta))
+                self._handle_pos[self._active_handle] - (self._scroll_wheel_step * rotation // delta))
         else:
             self.set_position(
-                self._handle_pos[self._active_handle] + (self._scroll_wheel_step * event.GetWheelRotation() // delta))
+                self._handle_pos[self._active_handle] + (self._scroll_wheel_step * rotation // delta))
 
     def on_left_down(self, event):
+        self._begin_press()
         self.mouse_move(event.GetPosition(), self.animated)
 
     def on_mouse_drag(self, event):
         if event.Dragging() and event.LeftIsDown():
-            self.mouse_move(event.GetPosition())
+            self.queue_input('drag', lambda pos=event.GetPosition(): self.mouse_move(pos))
         if event.Dragging() and event.RightIsDown():
             if self.range_bar == 2:
-                self.bar_move(event.GetPosition())
+                self.queue_input('bar_drag', lambda pos=event.GetPosition(): self.bar_move(pos))
         event.Skip()
 
-    def on_mouse_button_up(self, _):
+    def on_mouse_button_up(self, event):
+        self.flush_input()  # finish any queued drag before the drag state is reset
         self._not_dragging = True
         self._last_mouse_pos = None
+        event.Skip()  # allows a pending change event to be posted on release (see set_event_policy)
 
     def bar_move(self, mouse_pos):
         if not self.HasFocus():
@@ -329,6 +336,7 @@ class RangeSlider(ActiveImageControl):
                 return min(range(2), key=lambda i: abs(hand_pos[i] - mouse_pos))
 
     def on_leave(self, _):
+        self.flush_input()
         self._not_dragging = True
         self._last_mouse_pos = None
 
@@ -451,23 +459,49 @@ class RangeSlider(ActiveImageControl):
         """ Set cursor key step size (int > 0) """
         self._cursor_key_step = step
 
-    def set_position(self, pos=0):
-        """ Validate and Set the (actual pixel) position for the handle """
+    def set_position(self, pos=0, handle=None):
+        """ Validate and Set the (actual pixel) position for a handle (default is the active handle)
+            Any animation of the handle is interrupted
+        """
+        handle = self._active_handle if handle is None else handle
+        self.stop_animation(('handle', handle))
+        self._apply_position(pos, handle)
+
+    def _apply_position(self, pos, handle):
         valid_pos = self._validate_limit(pos, self._handle_max_pos)
-        if valid_pos != self._handle_pos[self._active_handle]:
-            self._handle_pos[self._active_handle] = valid_pos
-            if self._active_handle:
+        if valid_pos != self._handle_pos[handle]:
+            before = self._handle_rects()
+            self._handle_pos[handle] = valid_pos
+            if handle:
                 if self._handle_pos[0] > self._handle_pos[1]:
                     self._handle_pos[0] = self._handle_pos[1]
             elif self._handle_pos[1] < self._handle_pos[0]:
                 self._handle_pos[1] = self._handle_pos[0]
             self._send_event()
-            self.Refresh(True)
+            self.RefreshRect(self._dirty_rect(before, self._handle_rects()), False)
+
+    def _handle_rects(self):
+        """ Returns the areas covered by the (lo, hi) handles at their current positions """
+        return (wx.Rect(wx.Point(self.get_handle_point(self._handle_pos[0])), self._handle_size[0]),
+                wx.Rect(wx.Point(self.get_handle_point(self._handle_pos[1], True)), self._handle_size[1]))
+
+    def _dirty_rect(self, before, after):
+        """ Returns the area to repaint after the handles have moved from before to after (both as _handle_rects)
+            ie. the old and new areas of each handle that moved, plus the span of the range bar if it is shown
+        """
+        if self.range_bar:
+            rects = before + after
+        else:
+            rects = [rect for old, new in zip(before, after) if old != new for rect in (old, new)]
+        dirty = wx.Rect(rects[0])
+        for rect in rects[1:]:
+            dirty = dirty.Union(rect)
+        return dirty.Inflate(1, 1)  # the bar is drawn from 1 pixel outside the handles
 
     def set_evt_on_focus(self, val=True):
         self._evt_on_focus = val
 
-    # def set_evt_on_animate(self, val = True): # enable when threaded animation is used
+    # def set_evt_on_animate(self, val = True):
     #     self._evt_on_animate = val
 
     def reset_position(self):
@@ -484,30 +518,19 @@ class RangeSlider(ActiveImageControl):
     def value(self, percent):
         self.set_position(percent * self._handle_max_pos)
 
-    # TODO work on alternative animation method, threading? Can't use wx.timer as it's too slow
-    # Also consider variables for speed factor(0.85) and smoothness(step=4)
-
     # Animation methods #
     def _move_handle(self, destination, animate=True):
-        if animate:
-            curr_pos = self._handle_pos[self._active_handle]
-            max_pos = self._handle_max_pos
-            dest_pos = self._validate_limit(destination, max_pos)
-            diff = dest_pos - curr_pos
-            if diff:
-                step = 4 * int(diff / abs(diff))
-                for i in range(curr_pos, dest_pos, step):
-                    self.set_position(i)
-                    # if self._evt_on_animate:  # This may be reserved for threaded animation
-                    #     self._send_event()
-                    #     print('sent')
-                    # because we are using sleep in a loop, we are not returning control to the main loop
-                    # so we need to call update() to refresh the screen immediately - ie to 'animate'
-                    self.Update()
-                    if i != 0:
-                        time.sleep(ptw.easeInQuart(abs((curr_pos - i + 1) / diff)) / int(max_pos * 0.85))
-
-        self.set_position(destination)
+        """ Move the active handle to destination; animated moves run on the shared animator """
+        handle = self._active_handle
+        dest_pos = self._validate_limit(destination, self._handle_max_pos)
+        diff = dest_pos - self._handle_pos[handle]
+        if animate and diff:
+            duration = self.animation_duration * abs(diff) / self._handle_max_pos
+            self.animate(('handle', handle), self._handle_pos[handle], dest_pos, duration,
+                         lambda pos: self._apply_position(int(round(pos)), handle), self.animation_easing,
+                         lambda: self.set_position(dest_pos, handle))
+        else:
+            self.set_position(dest_pos, handle)
 
     # Helper methods #
     @staticmethod
@@ -528,7 +551,7 @@ class RangeSlider(ActiveImageControl):
             raise ValueError('The position value is not within the boundary of the slider widget')
 
     def _send_event(self):
-        wx.PostEvent(self, rs_cmd_event(id=self.GetId(), value=self.value))
+        self.post_event(rs_cmd_event, value=self.value)
 
 
 def rect_centre(size, origin=(0, 0)):
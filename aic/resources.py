@@ -0,0 +1,110 @@
+"""
+Shared bitmap resources
+
+Every file is read and decoded once; any further request for the same path - or for a different file with
+identical contents - is handed the bitmap already held. Panels with hundreds of identical controls then hold a
+single copy of each image, and as the bitmaps are shared, the rotation and tinted sprite caches (keyed by bitmap)
+are shared between the controls as well
+
+    from aic import load_bitmap
+    led_pair = (load_bitmap(os.path.join(RESOURCES, 'led1rect_inactive_dark_basic2.png')),
+                load_bitmap(os.path.join(RESOURCES, 'led1rect_active_dark_basic2.png')))
+
+Shared bitmaps must be treated as read-only - draw a copy (wx.Bitmap(bmp)) if it is to be altered
+"""
+
+import hashlib
+import io
+import os
+import threading
+
+import wx
+
+__all__ = ['BitmapLoader', 'get_loader', 'load_bitmap', 'resource_stats']
+
+_loader = None
+_loader_lock = threading.Lock()
+
+
+class BitmapLoader:
+    """ Loads bitmaps from files, deduplicating by (normalised) path and by content hash """
+
+    def __init__(self):
+        self._by_path = {}      # {normalised path: content digest}
+        self._by_digest = {}    # {content digest: wx.Bitmap}
+        self.hits = 0           # requests served without reading the file
+        self.duplicates = 0     # files read, but served a bitmap already decoded from identical contents
+        self.misses = 0         # files read and decoded
+
+    @staticmethod
+    def _normalise(path):
+        return os.path.normcase(os.path.realpath(path))
+
+    def load(self, path, bitmap_type=wx.BITMAP_TYPE_ANY):
+        """ Returns the shared wx.Bitmap for the image file at path """
+        key = self._normalise(path)
+        digest = self._by_path.get(key)
+        if digest is not None:
+            self.hits += 1
+            return self._by_digest[digest]
+
+        with open(key, 'rb') as file:
+            data = file.read()
+        digest = hashlib.sha1(data).hexdigest()
+        bitmap = self._by_digest.get(digest)
+        if bitmap is None:
+            image = wx.Image(io.BytesIO(data), bitmap_type)
+            if not image.IsOk():
+                raise ValueError(f'Unable to decode image: {path}')
+            bitmap = wx.Bitmap(image)
+            self._by_digest[digest] = bitmap
+            self.misses += 1
+        else:
+            self.duplicates += 1
+        self._by_path[key] = digest
+        return bitmap
+
+    def forget(self, path):
+        """ Stop serving the bitmap for path; the bitmap is released once no other path (or control) refers to it """
+        digest = self._by_path.pop(self._normalise(path), None)
+        if digest is not None and digest not in self._by_path.values():
+            del self._by_digest[digest]
+
+    def clear(self):
+        self._by_path.clear()
+        self._by_digest.clear()
+
+    @property
+    def nbytes(self):
+        """ Approximate memory held by the decoded bitmaps """
+        return sum(bmp.GetWidth() * bmp.GetHeight() * max(bmp.GetDepth(), 8) // 8 for bmp in self._by_digest.values())
+
+    def stats(self):
+        return {
+            'paths': len(self._by_path),
+            'bitmaps': len(self._by_digest),
+            'bytes': self.nbytes,
+            'hits': self.hits,
+            'duplicates': self.duplicates,
+            'misses': self.misses,
+        }
+
+
+def get_loader():
+    """ Returns the BitmapLoader shared by the application """
+    global _loader
+    if _loader is None:
+        with _loader_lock:
+            if _loader is None:
+                _loader = BitmapLoader()
+    return _loader
+
+
+def load_bitmap(path, bitmap_type=wx.BITMAP_TYPE_ANY):
+    """ Returns the shared wx.Bitmap for the image file at path (see BitmapLoader) """
+    return get_loader().load(path, bitmap_type)
+
+
+def resource_stats():
+    """ Returns the shared loader's counters and the memory held by its bitmaps """
+    return get_loader().stats()
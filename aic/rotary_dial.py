@@ -1,16 +1,15 @@
-import time
-from math import atan2, pi, degrees, radians
+from math import atan2, pi, degrees
 
 import wx
 from wx.lib.newevent import NewCommandEvent
-import pytweening as ptw
 
 from aic import ActiveImageControl
+from aic.util import rotate_bmp, get_rotation_cache, RotationCacheMixin, get_easing, instrument
 
 rd_cmd_event, EVT_RD_CHANGE = NewCommandEvent()
 
 
-class RotaryDial(ActiveImageControl):
+class RotaryDial(RotationCacheMixin, ActiveImageControl):
 
     def __init__(self, parent, bitmaps, *args, **kwargs):
         """
@@ -24,6 +23,7 @@ class RotaryDial(ActiveImageControl):
                         Even pixel dimensions will rotate slightly better (eg 50x50 not 51x51)
                         The rotating bitmap must be smaller than the base bitmap
                         It might be possible to do a partially exposed knob using a mask???
+                        (see set_filmstrip to use pre-rendered frames instead of rotating the pointer)
 
         EVT_RD_CHANGE: returns .value: float ->  the degrees difference from the 'zero' point of the dial
                                                 Positive values only, in clockwise rotation
@@ -54,6 +54,8 @@ class RotaryDial(ActiveImageControl):
         self._dynam_pos = self.stat_rot_pnt_centre - self._dynam_centre
         # degrees rotation to make pointer align with minimum position (-ve for counter-clockwise; +ve for clockwise)
         self._dynam_bmp_rot_offset = -135
+        self._rotation_cache = get_rotation_cache(self.dynam_bmp)
+        self._filmstrip = None  # list of pre-rendered pointer frames, used in place of rotation when set
 
         # degrees of rotation from the 3 o'clock position to the minimum limit of the dial ie (the zero position)
         self._zero_angle_offset = 0
@@ -64,6 +66,8 @@ class RotaryDial(ActiveImageControl):
         self.pointer_max_angle = 360
         self._pointer_limit_hit = None
         self._pointer_angle = self.pointer_default
+        self.animation_duration = 0.3  # seconds for an animated reset to sweep the full range of the dial
+        self.animation_easing = get_easing('easeOutQuart')
 
         self.highlight_box = ((0, 0), (0, 0))
 
@@ -84,15 +88,22 @@ class RotaryDial(ActiveImageControl):
         return size
 
     # Event handling #
+    @instrument.timed_paint
     def on_paint(self, _):
-        window_rect = self.GetRect()
-        buffer_bitmap = self.parent.bg_render.GetSubBitmap(window_rect)
-        self.draw_to_context(wx.BufferedPaintDC(self, buffer_bitmap))
-
-    def draw_to_context(self, dc):
-        dc.DrawBitmap(self.stat_bmp, self._stat_position)
-        indicator_angle = self._parse_angle(360 - self._pointer_angle - self._dynam_bmp_rot_offset)
-        indicator = self.rotate_bmp(self.dynam_bmp, indicator_angle)
+        self.draw_to_context(self.get_buffered_dc(self.static_layer), static=False)
+
+    @property
+    def static_layer(self):
+        return self.stat_bmp, self._stat_position
+
+    def draw_to_context(self, dc, static=True):
+        if static:
+            dc.DrawBitmap(self.stat_bmp, self._stat_position)
+        if self._filmstrip:
+            indicator = self._filmstrip[self._filmstrip_index()]
+        else:
+            indicator_angle = self._parse_angle(360 - self._pointer_angle - self._dynam_bmp_rot_offset)
+            indicator = self._rotated_pointer(indicator_angle)
         dc.DrawBitmap(indicator, self._dynam_pos)
 
         if self.highlight and self.HasFocus():
@@ -112,6 +123,7 @@ class RotaryDial(ActiveImageControl):
         event.Skip()
 
     def on_left_down(self, event):
+        self._begin_press()
         if not self.HasFocus():
             self.SetFocus()
         mouse_pos = event.GetPosition()
@@ -123,12 +135,14 @@ class RotaryDial(ActiveImageControl):
         if event.Dragging() and event.LeftIsDown():
             if not self.HasFocus():
                 self.SetFocus()
-            mouse_pos = event.GetPosition()
-            mouse_angle = angle_diff(mouse_pos, self.stat_rot_pnt_centre)
-            mouse_angle_offset = mouse_angle - self._zero_angle_offset
-            self.set_angle(mouse_angle_offset)
+            self.queue_input('drag', lambda pos=event.GetPosition(): self._drag_to(pos))
         event.Skip()
 
+    def _drag_to(self, mouse_pos):
+        mouse_angle = angle_diff(mouse_pos, self.stat_rot_pnt_centre)
+        mouse_angle_offset = mouse_angle - self._zero_angle_offset
+        self.set_angle(mouse_angle_offset)
+
     def on_middle_up(self, _):
         if not self.HasFocus():
             self.SetFocus()
@@ -137,9 +151,10 @@ class RotaryDial(ActiveImageControl):
     def on_mouse_wheel(self, event):
         if not self.HasFocus():
             self.SetFocus()
-        delta = event.GetWheelDelta()  # usually +/-120, but it's better not to assume
-        angle = self._pointer_angle + (self._scroll_step * event.GetWheelRotation() // delta)
-        self.set_angle(angle)
+        self.queue_wheel(event, self._wheel_move)
+
+    def _wheel_move(self, rotation, delta):
+        self.set_angle(self._pointer_angle + (self._scroll_step * rotation // delta))
 
     # Getters and Setters #
     def set_padding(self, padding=(0, 0)):
@@ -161,6 +176,29 @@ class RotaryDial(ActiveImageControl):
         self._dynam_bmp_rot_offset = self._parse_angle(angle)
         self._refresh()
 
+    def set_filmstrip(self, bitmap, frames, is_vertical=True):
+        """ Draw the pointer from a filmstrip (sprite-sheet) rather than by rotating the dynamic bitmap
+            bitmap is a strip of equally sized frames, stacked vertically or side by side (is_vertical=False)
+            The first frame represents the zero position, the last frame represents the maximum angle
+            Passing None for the bitmap returns the dial to rotating the dynamic bitmap
+        """
+        if bitmap is None:
+            self._filmstrip = None
+            self._set_dynam_size(self.dynam_bmp.Size)
+            return
+        if frames < 2:
+            raise ValueError('frames: Expected 2 or more frames')
+        w, h = bitmap.Size
+        if is_vertical:
+            frame_size = wx.Size(w, h // frames)
+            origins = [(0, i * frame_size.height) for i in range(frames)]
+        else:
+            frame_size = wx.Size(w // frames, h)
+            origins = [(i * frame_size.width, 0) for i in range(frames)]
+        self._refresh()
+        self._filmstrip = [bitmap.GetSubBitmap(wx.Rect(origin, frame_size)) for origin in origins]
+        self._set_dynam_size(frame_size)
+
     def set_zero_angle_offset(self, angle=0.0):
         self._zero_angle_offset = self._parse_angle(angle)
 
@@ -188,11 +226,15 @@ class RotaryDial(ActiveImageControl):
         self._key_step = step
 
     def set_angle(self, angle=0.0):
-        """ Set the rotational position of the dynamic image via an angle value """
+        """ Set the rotational position of the dynamic image via an angle value, interrupting any animation """
+        self.stop_animation('angle')
+        self._apply_angle(angle)
+
+    def _apply_angle(self, angle):
         angle_ = self._parse_angle(angle)
         if angle != self._pointer_angle:
             self._pointer_angle = self._parse_limits(angle_, self.pointer_max_angle)
-            wx.PostEvent(self, rd_cmd_event(id=self.GetId(), value=self._pointer_angle))
+            self.post_event(rd_cmd_event, value=self._pointer_angle)
             self._refresh()
 
     def reset(self, animate=True):
@@ -214,26 +256,46 @@ class RotaryDial(ActiveImageControl):
         self.stat_rot_pnt_centre = (self._stat_position + self._stat_centre + self.stat_rot_pnt_offset)
         self._dynam_pos = self.stat_rot_pnt_centre - self._dynam_centre
 
+    def _set_dynam_size(self, size):
+        self._dynam_size = size
+        self._dynam_centre = rect_centre(self._dynam_size)
+        self._dynam_pos = self.stat_rot_pnt_centre - self._dynam_centre
+        self._refresh()
+
+    def _filmstrip_index(self):
+        """ Returns the filmstrip frame representing the current pointer angle """
+        last = len(self._filmstrip) - 1
+        if not self.pointer_max_angle:
+            return 0
+        return min(last, max(0, int(round(self._pointer_angle / self.pointer_max_angle * last))))
+
     def _refresh(self):
         self.Refresh(True, (wx.Rect(self._dynam_pos, self._dynam_size)))
 
     def _animated_reset(self, animate=True):
-        if animate:
-            curr_pos = int(self._pointer_angle)
-            max_pos = self.pointer_max_angle
-            dest_pos = self.pointer_default
-            diff = dest_pos - curr_pos
-            if diff:
-                step = 4 * int(diff / abs(diff))
-                for i in range(curr_pos, dest_pos, step):
-                    self.set_angle(i)
-                    self.Update()  # in this case, the buffer won't empty until update() is called
-                    if i != 0:
-                        time.sleep(ptw.easeInQuart(abs((curr_pos - i + 1) / diff)) / int(max_pos * 0.85))
-                        # TODO don't like sleeping the tween - threading version, maybe use position not time
+        """ Return the pointer to its default angle; the animation runs on the shared animator
+            Intermediate angles are drawn without generating events, one event is sent on completion
+        """
         # Also extend function for clicking on a point animation
-        self.set_angle(self.pointer_default)
+        diff = self.pointer_default - self._pointer_angle
+        if animate and diff:
+            duration = self.animation_duration * abs(diff) / (self.pointer_max_angle or 360)
+            self.animate('angle', self._pointer_angle, self.pointer_default, duration,
+                         self._step_angle, self.animation_easing, self._finish_reset)
+        else:
+            self.set_angle(self.pointer_default)
+            self._pointer_limit_hit = None
+
+    def _step_angle(self, angle):
+        """ Draw the pointer at an intermediate angle of an animation """
+        self._pointer_angle = angle
+        self._refresh()
+
+    def _finish_reset(self):
+        self._pointer_angle = self.pointer_default
         self._pointer_limit_hit = None
+        self.post_event(rd_cmd_event, value=self._pointer_angle)
+        self._refresh()
 
     def _parse_limits(self, angle, max_angle):
         parsed_angle = angle
@@ -256,15 +318,7 @@ class RotaryDial(ActiveImageControl):
 
     @staticmethod
     def rotate_bmp(bmp, deg):
-        radian = radians(deg)
-        img = bmp.ConvertToImage()
-        img_centre = rect_centre(img.GetSize())
-        rot_img = img.Rotate(radian, (0, 0))
-        rot_img_centre = rect_centre(rot_img.GetSize())
-        offset = wx.Point(rot_img_centre - img_centre)
-        rot_sub_img = rot_img.GetSubImage((wx.Rect(offset, img.GetSize())))
-        rot_sub_bmp = rot_sub_img.ConvertToBitmap()
-        return rot_sub_bmp
+        return rotate_bmp(bmp, deg)
 
 
 def angle_diff(point, origin):
@@ -1,16 +1,15 @@
-import time
-from math import atan2, pi, degrees, radians
+from math import atan2, pi, degrees
 
 import wx
 from wx.lib.newevent import NewCommandEvent
-import pytweening as ptw
 
 from aic import ActiveImageControl
+from aic.util import rotate_bmp, get_rotation_cache, RotationCacheMixin, get_easing, instrument
 
 rs_cmd_event, EVT_RS_CHANGE = NewCommandEvent()
 
 
-class RotarySwitch(ActiveImageControl):
+class RotarySwitch(RotationCacheMixin, ActiveImageControl):
 
     def __init__(self, parent, bitmaps, *args, **kwargs):
         """
@@ -49,6 +48,7 @@ class RotarySwitch(ActiveImageControl):
         self._dynam_pos = self.stat_rot_pnt_centre - self._dynam_centre
         # degrees rotation to make pointer align with minimum position (-ve for counter-clockwise; +ve for clockwise)
         self._dynam_bmp_rot_offset = -135
+        self._rotation_cache = get_rotation_cache(self.dynam_bmp)
 
         # degrees of rotation from the 3 o'clock position to the minimum limit of the dial ie (the zero position)
         self._zero_angle_offset = 0
@@ -59,6 +59,8 @@ class RotarySwitch(ActiveImageControl):
         self.pointer_max_angle = 360
         self._pointer_limit_hit = None
         self._pointer_angle = self.pointer_default
+        self.animation_duration = 0.3  # seconds for an animated reset to sweep the full range of the switch
+        self.animation_easing = get_easing('easeOutExpo')
 
         self.highlight_box = ((0, 0), (0, 0))
 
@@ -79,15 +81,19 @@ class RotarySwitch(ActiveImageControl):
         return size
 
     # Event handling #
+    @instrument.timed_paint
     def on_paint(self, _):
-        window_rect = self.GetRect()
-        buffer_bitmap = self.parent.bg_render.GetSubBitmap(window_rect)
-        self.draw_to_context(wx.BufferedPaintDC(self, buffer_bitmap))
+        self.draw_to_context(self.get_buffered_dc(self.static_layer), static=False)
 
-    def draw_to_context(self, dc):
-        dc.DrawBitmap(self.stat_bmp, self.stat_padding)
+    @property
+    def static_layer(self):
+        return self.stat_bmp, self.stat_padding
+
+    def draw_to_context(self, dc, static=True):
+        if static:
+            dc.DrawBitmap(self.stat_bmp, self.stat_padding)
         indicator_angle = self._parse_angle(360 - self._pointer_angle - self._dynam_bmp_rot_offset)
-        indicator = self.rotate_bmp(self.dynam_bmp, indicator_angle)
+        indicator = self._rotated_pointer(indicator_angle)
         dc.DrawBitmap(indicator, self._dynam_pos)
 
         if self.highlight and self.HasFocus():
@@ -107,6 +113,7 @@ class RotarySwitch(ActiveImageControl):
         event.Skip()
 
     def on_left_down(self, event):
+        self._begin_press()
         if not self.HasFocus():
             self.SetFocus()
         mouse_pos = event.GetPosition()
@@ -183,11 +190,12 @@ class RotarySwitch(ActiveImageControl):
         self._key_step = step
 
     def set_angle(self, angle=0.0):
-        """ Set the rotational position of the dynamic image via an angle value """
+        """ Set the rotational position of the dynamic image via an angle value, interrupting any animation """
+        self.stop_animation('angle')
         angle_ = self._parse_angle(angle)
         if angle != self._pointer_angle:
             self._pointer_angle = self._parse_limits(angle_, self.pointer_max_angle)
-            wx.PostEvent(self, rs_cmd_event(id=self.GetId(), state=self._pointer_angle))
+            self.post_event(rs_cmd_event, state=self._pointer_angle)
             self._refresh()
 
     def reset(self, animate=True):
@@ -213,24 +221,28 @@ class RotarySwitch(ActiveImageControl):
         self.Refresh(True, (wx.Rect(self._dynam_pos, self._dynam_size)))
 
     def _animated_reset(self, animate=True):
-        # TODO send animation to thread? or callAfter?
+        """ Return the pointer to its default angle; the animation runs on the shared animator
+            Intermediate angles are drawn without generating events, one event is sent on completion
+        """
         # Also extend function for clicking on a point animation
-        # Also balance up speed for midpoint reset_position ( it goes fast one way than the other) zero point reset_position is fine
-        if not animate:
-            self.set_angle(self.pointer_default)
+        diff = self.pointer_default - self._pointer_angle
+        if animate and diff:
+            duration = self.animation_duration * abs(diff) / (self.pointer_max_angle or 360)
+            self.animate('angle', self._pointer_angle, self.pointer_default, duration,
+                         self._step_angle, self.animation_easing, self._finish_reset)
         else:
-            current_position = int(self._pointer_angle)
-            if self._pointer_angle != self.pointer_default:
-                step = -1 if current_position > self.pointer_default else 1
-                for i in range(current_position, self.pointer_default, step):
-                    self._pointer_angle = i
-                    self.Update()  # in this case, the buffer won't empty until update() is called
-                    if i != 0:
-                        time.sleep(ptw.easeOutExpo(1 / i) / 85)
-                        # TODO don't like sleeping the tween - threading version, maybe use position not time
-                    self._refresh()
-                self.set_angle(self.pointer_default)
-                self._pointer_limit_hit = None
+            self.set_angle(self.pointer_default)
+
+    def _step_angle(self, angle):
+        """ Draw the pointer at an intermediate angle of an animation """
+        self._pointer_angle = angle
+        self._refresh()
+
+    def _finish_reset(self):
+        self._pointer_angle = self.pointer_default
+        self._pointer_limit_hit = None
+        self.post_event(rs_cmd_event, state=self._pointer_angle)
+        self._refresh()
 
     def _parse_limits(self, angle, max_angle):
         parsed_angle = angle
@@ -253,15 +265,7 @@ class RotarySwitch(ActiveImageControl):
 
     @staticmethod
     def rotate_bmp(bmp, deg):
-        radian = radians(deg)
-        img = bmp.ConvertToImage()
-        img_centre = rect_centre(img.GetSize())
-        rot_img = img.Rotate(radian, (0, 0))
-        rot_img_centre = rect_centre(rot_img.GetSize())
-        offset = wx.Point(rot_img_centre - img_centre)
-        rot_sub_img = rot_img.GetSubImage((wx.Rect(offset, img.GetSize())))
-        rot_sub_bmp = rot_sub_img.ConvertToBitmap()
-        return rot_sub_bmp
+        return rotate_bmp(bmp, deg)
 
 
 def angle_diff(point, origin):
@@ -1,11 +1,8 @@
-import time
-
 import wx
 from wx.lib.newevent import NewCommandEvent
-import pytweening as ptw
 
 from aic import ActiveImageControl
-from aic.util import make_padding
+from aic.util import make_padding, get_easing, instrument
 
 sss_cmd_event, EVT_SSS_CHANGE = NewCommandEvent()
 
@@ -60,7 +57,9 @@ class SimpleSlideSwitch(ActiveImageControl):
         self._scroll_wheel_step = 1
         self._cursor_key_step = 1
         self._evt_on_focus = False
-        # self._evt_on_animate = True   # enable when threaded animation is used
+        # self._evt_on_animate = True   # enable to generate an event for each step of the animation
+        self.animation_duration = 0.25  # seconds for the handle to travel the full length of the axis
+        self.animation_easing = get_easing('easeOutQuart')
 
         self.highlight_box = ((0, 0), (0, 0))
 
@@ -81,13 +80,23 @@ class SimpleSlideSwitch(ActiveImageControl):
         return size
 
     # Event handling #
+    @instrument.timed_paint
     def on_paint(self, _):
-        window_rect = self.GetRect()
-        buffer_bitmap = self.parent.bg_render.GetSubBitmap(window_rect)
-        self.draw_to_context(wx.BufferedPaintDC(self, buffer_bitmap))
+        if self._handle_pos in self._ticklist:
+            # resting on a tick
+            self.paint_render((self._handle_pos, tuple(self._static_pos), tuple(self._handle_offset)),
+                              self.draw_to_context, (self.static_bmp, self.handle_bmp))
+        else:
+            # moving between ticks
+            self.draw_to_context(self.get_buffered_dc(self.static_layer), static=False)
+
+    @property
+    def static_layer(self):
+        return self.static_bmp, self._static_pos
 
-    def draw_to_context(self, dc):
-        dc.DrawBitmap(self.static_bmp, self._static_pos)  # Draws foundation image
+    def draw_to_context(self, dc, static=True):
+        if static:
+            dc.DrawBitmap(self.static_bmp, self._static_pos)  # Draws foundation image
         dc.DrawBitmap(self.handle_bmp, self.get_handle_point())  # Draws handle image
 
         if self.highlight and self.HasFocus():
@@ -128,6 +137,7 @@ class SimpleSlideSwitch(ActiveImageControl):
             self.set_tick(self._curr_tick + self._scroll_wheel_step * event.GetWheelRotation() // delta)
 
     def on_left_down(self, event):
+        self._begin_press()
         self.mouse_move(event.GetPosition())
 
     def on_left_drag(self, event):
@@ -204,6 +214,10 @@ class SimpleSlideSwitch(ActiveImageControl):
         else:
             return self._handle_pos + x_base, y_base
 
+    def _handle_rect(self):
+        """ Returns the area covered by the handle at its current position """
+        return wx.Rect(wx.Point(self.get_handle_point()), self._handle_size)
+
     def set_default_tick(self, tick=0):
         """ Set the default tick position for the handle, resetting will place the handle at this point"""
         if 0 <= tick < len(self._ticklist):  # make sure the tick value is within range
@@ -240,15 +254,25 @@ class SimpleSlideSwitch(ActiveImageControl):
         if tick != self._curr_tick:
             self._curr_tick = tick
             self.set_position(self._ticklist[tick])
-            self.Refresh(True)
 
     def set_position(self, pos=0):
-        """ Parse and Set the (actual pixel) position for the handle """
-        valid_pos = self._validate_limits(pos, self._handle_max_pos)
-        if valid_pos != self._handle_pos:
-            self._handle_pos = valid_pos
+        """ Parse and Set the (actual pixel) position for the handle, interrupting any animation """
+        self.stop_animation('handle')
+        self._apply_position(pos)
+
+    def _apply_position(self, pos):
+        if self._step_position(pos):
             self._send_event()
-            self.Refresh(True)
+
+    def _step_position(self, pos):
+        """ Move the handle without sending an event; returns True if it has moved """
+        valid_pos = self._validate_limits(pos, self._handle_max_pos)
+        if valid_pos == self._handle_pos:
+            return False
+        before = self._handle_rect()
+        self._handle_pos = valid_pos
+        self.RefreshRect(before.Union(self._handle_rect()), False)
+        return True
 
     def reset_position(self, animate=True):
 
@@ -265,23 +289,24 @@ class SimpleSlideSwitch(ActiveImageControl):
 
     # Animation methods #
     def _animate(self, destination, animate=True):
-        if animate:
-            max_pos = self._handle_max_pos
-            curr_pos = self._ticklist[self._curr_tick]
-            dest_pos = self._ticklist[destination]
-            diff = dest_pos - curr_pos
-            if diff:
-                step_dir = int(diff / abs(diff))
-                step = 4 * step_dir
-                for i in range(curr_pos, dest_pos, step):
-                    self.set_position(i)
-                    # because we are using sleep in a loop, we are not returning control to the main loop
-                    # so we need to call update() to refresh the screen immediately - ie to 'animate'
-                    self.Update()
-                    if i != 0:
-                        time.sleep(ptw.easeInQuart(abs((curr_pos - i + 1) / diff)) / int(max_pos * 0.85))
-
-        self.set_tick(self._tick_default)
+        """ Move the handle to the destination tick; animated moves run on the shared animator
+            Intermediate positions are drawn without generating events, one event is sent on arrival
+        """
+        dest_pos = self._ticklist[destination]
+        diff = dest_pos - self._handle_pos
+        self._curr_tick = destination
+
+        if animate and diff:
+            duration = self.animation_duration * abs(diff) / self._handle_max_pos
+            self.animate('handle', self._handle_pos, dest_pos, duration,
+                         lambda pos: self._step_position(int(round(pos))), self.animation_easing,
+                         lambda: self._finish_animation(dest_pos))
+        else:
+            self.set_position(dest_pos)
+
+    def _finish_animation(self, dest_pos):
+        self._step_position(dest_pos)
+        self._send_event()
 
     # Helper methods #
     @staticmethod
@@ -302,7 +327,7 @@ class SimpleSlideSwitch(ActiveImageControl):
             raise ValueError('The position value is not within the boundary of the slider widget')
 
     def _send_event(self):
-        wx.PostEvent(self, sss_cmd_event(id=self.GetId(), value=self.value))
+        self.post_event(sss_cmd_event, value=self.value)
 
 
 def rect_centre(size, origin=(0, 0)):
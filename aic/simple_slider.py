@@ -1,10 +1,7 @@
-import time
-
 import wx
 from wx.lib.newevent import NewCommandEvent
-import pytweening as ptw
 from aic import ActiveImageControl
-from aic.util import make_padding
+from aic.util import make_padding, get_easing, instrument
 
 ss_cmd_event, EVT_SS_CHANGE = NewCommandEvent()
 
@@ -55,7 +52,9 @@ class SimpleSlider(ActiveImageControl):
         self._scroll_wheel_step = 1
         self._cursor_key_step = 1
         self._evt_on_focus = False
-        # self._evt_on_animate = True   # enable when threaded animation is used
+        # self._evt_on_animate = True   # enable to generate an event for each step of the animation
+        self.animation_duration = 0.25  # seconds for the handle to travel the full length of the axis
+        self.animation_easing = get_easing('easeOutQuart')
 
         self.highlight_box = ((0, 0), (0, 0))
 
@@ -77,13 +76,17 @@ class SimpleSlider(ActiveImageControl):
         return size
 
     # Event handling #
+    @instrument.timed_paint
     def on_paint(self, _):
-        window_rect = self.GetRect()
-        buffer_bitmap = self.parent.bg_render.GetSubBitmap(window_rect)
-        self.draw_to_context(wx.BufferedPaintDC(self, buffer_bitmap))
+        self.draw_to_context(self.get_buffered_dc(self.static_layer), static=False)
+
+    @property
+    def static_layer(self):
+        return self.static_bmp, self._static_pos
 
-    def draw_to_context(self, dc):
-        dc.DrawBitmap(self.static_bmp, self._static_pos)  # Draws foundation image
+    def draw_to_context(self, dc, static=True):
+        if static:
+            dc.DrawBitmap(self.static_bmp, self._static_pos)  # Draws foundation image
         dc.DrawBitmap(self.handle_bmp, self._get_handle_point())  # Draws handle image
 
         if self.highlight and self.HasFocus():
@@ -118,19 +121,21 @@ class SimpleSlider(ActiveImageControl):
             self.SetFocus()
             if self._evt_on_focus:
                 self._send_event()
-        delta = event.GetWheelDelta()  # normally +/-120, but better not to assume
+        self.queue_wheel(event, self._wheel_move)
 
+    def _wheel_move(self, rotation, delta):
         if self.vertical:
-            self.set_position(self._handle_pos - (self._scroll_wheel_step * event.GetWheelRotation() // delta))
+            self.set_position(self._handle_pos - (self._scroll_wheel_step * rotation // delta))
         else:
-            self.set_position(self._handle_pos + (self._scroll_wheel_step * event.GetWheelRotation() // delta))
+            self.set_position(self._handle_pos + (self._scroll_wheel_step * rotation // delta))
 
     def on_left_down(self, event):
+        self._begin_press()
         self.mouse_move(event.GetPosition(), True)
 
     def on_left_drag(self, event):
         if event.Dragging() and event.LeftIsDown():
-            self.mouse_move(event.GetPosition())
+            self.queue_input('drag', lambda pos=event.GetPosition(): self.mouse_move(pos))
         event.Skip()
 
     def mouse_move(self, mouse_pos, animate=False):
@@ -167,6 +172,10 @@ class SimpleSlider(ActiveImageControl):
         else:
             return self._handle_pos + x_base, y_base
 
+    def _handle_rect(self):
+        """ Returns the area covered by the handle at its current position """
+        return wx.Rect(wx.Point(self._get_handle_point()), self._handle_size)
+
     def _set_max(self, pos):
         """ Set the maximum position value for the handle (ie the axis length in pixels) """
         index = self.vertical
@@ -209,48 +218,39 @@ class SimpleSlider(ActiveImageControl):
         self._cursor_key_step = step
 
     def set_position(self, pos=0):
-        """ Validate and Set the (actual pixel) position for the handle """
+        """ Validate and Set the (actual pixel) position for the handle, interrupting any animation """
+        self.stop_animation('handle')
+        self._apply_position(pos)
+
+    def _apply_position(self, pos):
         valid_pos = self._validate_limit(pos, self._handle_max_pos)
         if valid_pos != self._handle_pos:
+            before = self._handle_rect()
             self._handle_pos = valid_pos
             self._send_event()
-            self.Refresh(True)
+            self.RefreshRect(before.Union(self._handle_rect()), False)
 
     def set_evt_on_focus(self, val=True):
         self._evt_on_focus = val
 
-    # def set_evt_on_animate(self, val = True): # enable if/when threaded animation is implemented
+    # def set_evt_on_animate(self, val = True):
     #     self._evt_on_animate = val
 
     def reset_position(self, animate=True):
         self._animate(self._handle_default, animate)
 
-    # TODO consider on alternative animation method, threading? Can't use wx.timer as it's too slow
-    # Also consider variables for speed factor(0.85) and smoothness(step=4)
-
     # Animation methods #
     def _animate(self, destination, animate=True):
-        if animate:
-            curr_pos = self._handle_pos
-            max_pos = self._handle_max_pos
-            dest_pos = destination
-            diff = dest_pos - curr_pos
-            if diff:
-                step = 4 * int(diff / abs(diff))
-                for i in range(curr_pos, dest_pos, step):
-                    self.set_position(i)
-
-                    # if self._evt_on_animate:  # This may be reserved for threaded animation
-                    #     self._send_event()
-                    #     print('sent')
-
-                    # because we are using sleep in a loop, we are not returning control to the main loop
-                    # so we need to call update() to refresh the screen immediately - ie to 'animate'
-                    self.Update()
-                    if i != 0:
-                        time.sleep(ptw.easeInQuart(abs((curr_pos - i + 1) / diff)) / int(max_pos * 0.85))
-
-        self.set_position(destination)
+        """ Move the handle to destination; animated moves run on the shared animator and return immediately """
+        dest_pos = self._validate_limit(destination, self._handle_max_pos)
+        diff = dest_pos - self._handle_pos
+        if animate and diff:
+            duration = self.animation_duration * abs(diff) / self._handle_max_pos
+            self.animate('handle', self._handle_pos, dest_pos, duration,
+                         lambda pos: self._apply_position(int(round(pos))), self.animation_easing,
+                         lambda: self.set_position(dest_pos))
+        else:
+            self.set_position(dest_pos)
 
     # Helper methods #
     @staticmethod
@@ -271,7 +271,7 @@ class SimpleSlider(ActiveImageControl):
             raise ValueError('The position value is not within the boundary of the slider widget')
 
     def _send_event(self):
-        wx.PostEvent(self, ss_cmd_event(id=self.GetId(), value=self.value))
+        self.post_event(ss_cmd_event, value=self.value)
 
     # Properties #
     @property
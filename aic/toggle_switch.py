@@ -1,6 +1,7 @@
 import wx
 from wx.lib.newevent import NewCommandEvent
 from aic import ActiveImageControl
+from aic.util import instrument
 
 ts_cmd_event, EVT_TS_CHANGE = NewCommandEvent()
 
@@ -45,14 +46,15 @@ class ToggleSwitch(ActiveImageControl):
         return size
 
     # Event Handling #
+    @instrument.timed_paint
     def on_paint(self, _):
-        window_rect = self.GetRect()
-        buffer_bitmap = self.parent.bg_render.GetSubBitmap(window_rect)
-        dc = wx.BufferedPaintDC(self, buffer_bitmap)
+        self.paint_render((self._state, tuple(self.stat_padding)), self.draw_to_context, self.bmp_pair)
+
+    def draw_to_context(self, dc):
         dc.DrawBitmap(self.stat_bmp, self.stat_padding)
 
         if self.highlight and self.HasFocus():
-            self.draw_highlight(dc, ((0, 0), (4, 4)))
+            self.draw_highlight(dc, self.GetSize(), ((0, 0), (4, 4)))
 
     def on_keypress(self, event):
         if self.HasFocus():
@@ -1,6 +1,57 @@
 # util\__init__.py
+# Names are imported lazily, on first access - eg numpy (compose) and pytweening (easing) are only imported
+# if a control uses them
 
-from .bitmap import dc_to_bitmap, save_bmp_to_file
-from .padding import make_padding, Padding
+import importlib
 
-__all__ = [bitmap.dc_to_bitmap, bitmap.save_bmp_to_file, padding.make_padding, padding.Padding]
+_exports = {
+    'dc_to_bitmap': 'bitmap',
+    'save_bmp_to_file': 'bitmap',
+    'tile_bitmap': 'bitmap',
+    'make_padding': 'padding',
+    'Padding': 'padding',
+    'rotate_bmp': 'rotation',
+    'RotationCache': 'rotation',
+    'RotationCacheMixin': 'rotation',
+    'get_rotation_cache': 'rotation',
+    'clear_rotation_caches': 'rotation',
+    'MatrixCompositor': 'compose',
+    'bitmap_to_rgba': 'compose',
+    'HAS_NUMPY': 'compose',
+    'get_tinted_sprite': 'sprite',
+    'clear_sprite_cache': 'sprite',
+    'set_sprite_budget': 'sprite',
+    'Animator': 'animation',
+    'get_animator': 'animation',
+    'EasingTable': 'easing',
+    'get_easing': 'easing',
+    'ValueMailbox': 'mailbox',
+    'get_mailbox': 'mailbox',
+    'GridIndex': 'spatial',
+    'RefreshHoldMixin': 'refresh',
+    'instrument': None,  # the module itself
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        # a submodule (eg aic.util.rotation) is still reachable as an attribute after `import aic.util`
+        try:
+            return importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as error:
+            if error.name != f'{__name__}.{name}':
+                raise  # the submodule exists, but something it imports doesn't
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    module_name = _exports[name]
+    if module_name is None:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # later lookups don't come through here
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
@@ -0,0 +1,131 @@
+# animation.py
+
+import time
+
+import wx
+
+__all__ = ['Animator', 'get_animator', 'linear']
+
+FRAME_INTERVAL = 16  # milliseconds between frames (approx. 60 fps)
+
+_animator = None
+
+
+def linear(progress):
+    return progress
+
+
+class Tween:
+    """ A single value moving from start to end over duration (seconds), shaped by an easing function """
+
+    def __init__(self, start, end, duration, setter, easing=linear, on_done=None):
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.setter = setter
+        self.easing = easing
+        self.on_done = on_done
+        self.start_time = time.perf_counter()
+        self.value = start
+
+    def step(self, now):
+        """ Apply the value for the time now; returns True once the tween has completed """
+        if self.duration > 0:
+            progress = min(1.0, (now - self.start_time) / self.duration)
+        else:
+            progress = 1.0
+        self.value = self.start + (self.end - self.start) * self.easing(progress)
+        self.setter(self.value)
+        return progress >= 1.0
+
+
+class Animator(wx.EvtHandler):
+    """
+    Runs tweens for any number of controls from a single frame clock (one wx.Timer)
+    Tweens are stepped from the event loop, so animation never blocks the application
+    Each tween is identified by its (target, key); starting a tween with the same identity retargets it,
+    continuing from the current value, and a tween can be cancelled (interrupted) at any time
+
+    The same clock runs scheduled callbacks - each called once, at the next frame, with only the latest
+    callback for a (target, key) being kept; used to coalesce high rate input to the display rate
+    """
+
+    def __init__(self, interval=FRAME_INTERVAL):
+        super().__init__()
+        self.interval = interval
+        self._tweens = {}
+        self._scheduled = {}
+        self._timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self._on_tick, self._timer)
+
+    def animate(self, target, key, start, end, duration, setter, easing=linear, on_done=None):
+        """
+        Start (or retarget) a tween
+
+        :param target:  the object being animated (eg the control)
+        :param key:     identifies the animated property, so a target can run several tweens at once
+        :param start:   value at the beginning of the tween; if the tween is already running, the current value is used
+        :param end:     value at the end of the tween
+        :param duration: float - seconds
+        :param setter:  callable, passed each new value
+        :param easing:  callable mapping progress (0-1) to eased progress (0-1) - eg a pytweening function
+        :param on_done: callable, called (without arguments) when the tween completes; not called if cancelled
+        """
+        running = self._tweens.get((id(target), key))
+        if running is not None:
+            start = running[1].value
+        self._tweens[(id(target), key)] = (target, Tween(start, end, duration, setter, easing, on_done))
+        if not self._timer.IsRunning():
+            self._timer.Start(self.interval)
+
+    def schedule(self, target, key, callback):
+        """ Call callback (without arguments) at the next frame, replacing any callback already scheduled for the
+            same (target, key) - latest wins
+        """
+        self._scheduled[(id(target), key)] = (target, callback)
+        if not self._timer.IsRunning():
+            self._timer.Start(self.interval)
+
+    def flush(self, target, key=None):
+        """ Run the target's scheduled callback for key (or all of its callbacks if key is None) immediately """
+        for call_id in [cid for cid in self._scheduled if cid[0] == id(target) and (key is None or cid[1] == key)]:
+            _, callback = self._scheduled.pop(call_id)
+            callback()
+
+    def cancel(self, target, key=None):
+        """ Stop the target's tween identified by key, or all of the target's tweens if key is None """
+        for tween_id in [tid for tid in self._tweens if tid[0] == id(target) and (key is None or tid[1] == key)]:
+            del self._tweens[tween_id]
+
+    def is_animating(self, target, key=None):
+        return any(tid[0] == id(target) and (key is None or tid[1] == key) for tid in self._tweens)
+
+    def _on_tick(self, _):
+        scheduled, self._scheduled = self._scheduled, {}
+        for target, callback in scheduled.values():
+            if isinstance(target, wx.Window) and not target:
+                continue  # the window has been destroyed
+            callback()
+
+        now = time.perf_counter()
+        for tween_id, (target, tween) in list(self._tweens.items()):
+            if self._tweens.get(tween_id, (None, None))[1] is not tween:
+                continue  # cancelled or retargeted by an earlier setter during this frame
+            if isinstance(target, wx.Window) and not target:
+                del self._tweens[tween_id]  # the window has been destroyed
+                continue
+            finished = tween.step(now)
+            if finished and self._tweens.get(tween_id, (None, None))[1] is tween:
+                del self._tweens[tween_id]
+                if tween.on_done:
+                    tween.on_done()
+        if not self._tweens and not self._scheduled:
+            self._timer.Stop()
+
+
+def get_animator():
+    """ Returns the Animator shared by all controls (created on first use, a wx.App must exist) """
+    global _animator
+    if _animator is None:
+        _animator = Animator()
+    return _animator
@@ -2,7 +2,7 @@
 
 import wx
 
-__all__ = ['dc_to_bitmap', 'save_bmp_to_file']
+__all__ = ['dc_to_bitmap', 'save_bmp_to_file', 'tile_bitmap']
 
 
 def save_bmp_to_file(bmp, filepath, filetype=wx.BITMAP_TYPE_PNG):
@@ -20,3 +20,38 @@ def dc_to_bitmap(window, background_dc):
     dc.Blit(0, 0, width, height, background_dc, 0, 0)
     dc.SelectObject(wx.NullBitmap)
     return bitmap
+
+
+def tile_bitmap(bitmap, size, colour=None):
+    """
+    returns a bitmap of the requested size, tiled with copies of bitmap
+    Rather than drawing every tile, the first tile is drawn and the filled area is then repeatedly doubled
+    (first across, then down) by blitting it onto itself - a full re-tile costs a handful of blits
+
+    :param bitmap: wx.Bitmap - the tile
+    :param size: wx.Size (width, height) of the bitmap returned
+    :param colour: wx.Colour drawn beneath the tiles (use if the tile has transparency) or None
+    """
+    width, height = max(size[0], 1), max(size[1], 1)
+    tile_w, tile_h = bitmap.GetSize()
+    surface = wx.Bitmap(width, height)
+
+    dc = wx.MemoryDC(surface)
+    if colour is not None:
+        dc.SetBackground(wx.Brush(colour))
+        dc.Clear()
+    dc.DrawBitmap(bitmap, 0, 0, True)
+
+    filled = tile_w
+    while filled < width:
+        span = min(filled, width - filled)
+        dc.Blit(filled, 0, span, tile_h, dc, 0, 0)
+        filled += span
+    filled = tile_h
+    while filled < height:
+        span = min(filled, height - filled)
+        dc.Blit(0, filled, width, span, dc, 0, 0)
+        filled += span
+
+    dc.SelectObject(wx.NullBitmap)
+    return surface
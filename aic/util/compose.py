@@ -0,0 +1,87 @@
+# compose.py
+
+import wx
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - only required by the MatrixCompositor
+    np = None
+
+__all__ = ['MatrixCompositor', 'bitmap_to_rgba', 'HAS_NUMPY']
+
+HAS_NUMPY = np is not None
+
+
+def bitmap_to_rgba(bmp):
+    """ returns a (height, width, 4) uint8 numpy array of the bitmap's RGBA pixels (masks become alpha) """
+    img = bmp.ConvertToImage()
+    if not img.HasAlpha():
+        img.InitAlpha()
+    w, h = img.GetSize()
+    rgba = np.empty((h, w, 4), dtype=np.uint8)
+    rgba[..., :3] = np.frombuffer(bytes(img.GetData()), dtype=np.uint8).reshape(h, w, 3)
+    rgba[..., 3] = np.frombuffer(bytes(img.GetAlpha()), dtype=np.uint8).reshape(h, w)
+    return rgba
+
+
+def _over(dst, src):
+    """ alpha composite src over dst (both float arrays, 0-1, non-premultiplied RGBA) """
+    src_a = src[..., 3:4]
+    dst_a = dst[..., 3:4]
+    out_a = src_a + dst_a * (1 - src_a)
+    safe_a = np.where(out_a == 0, 1, out_a)
+    out = np.empty_like(dst)
+    out[..., :3] = (src[..., :3] * src_a + dst[..., :3] * dst_a * (1 - src_a)) / safe_a
+    out[..., 3:4] = out_a
+    return out
+
+
+class MatrixCompositor:
+    """
+    Composes a whole matrix of two state sprites as a single vectorised numpy operation
+    The sprites are decomposed into RGBA arrays once; each frame is built from a 2-D state array and
+    copied into a persistent wx.Bitmap, which can then be drawn with a single blit
+
+    :param bitmaps: An iterable of two equally sized wx.Bitmap objects (off, on)
+    :param colour:  wx.Colour painted beneath each sprite (for mask style LEDs) or None
+    :param shrink:  Int - reduce the colour rectangle by this many pixels on each side
+    :param spacing: Int - pixels between cells
+    """
+
+    def __init__(self, bitmaps, colour=None, shrink=0, spacing=1):
+        if np is None:
+            raise ImportError('numpy is required to use the MatrixCompositor')
+        self.spacing = spacing
+        self.sprites = self._make_sprites(bitmaps, colour, shrink)  # shape (2, cell_h, cell_w, 4)
+        self._bitmap = None
+
+    def _make_sprites(self, bitmaps, colour, shrink):
+        off, on = (bitmap_to_rgba(bmp) for bmp in bitmaps)
+        h, w, _ = off.shape
+        sp = self.spacing
+        sprites = np.zeros((2, h + sp, w + sp, 4), dtype=np.uint8)
+        for index, rgba in enumerate((off, on)):
+            cell = np.zeros((h, w, 4), dtype=np.float32)
+            if colour is not None:
+                cell[shrink:h - shrink, shrink:w - shrink] = [c / 255 for c in colour.Get(includeAlpha=True)]
+            cell = _over(cell, rgba.astype(np.float32) / 255)
+            sprites[index, :h, :w] = np.rint(cell * 255).astype(np.uint8)
+        return sprites
+
+    def compose(self, state):
+        """ returns the RGBA array for a 2-D (rows, columns) array of 0 (off) / non-zero (on) values """
+        state = (np.asarray(state) != 0).astype(np.uint8)
+        rows, columns = state.shape
+        _, cell_h, cell_w, _ = self.sprites.shape
+        tiles = self.sprites[state]  # (rows, columns, cell_h, cell_w, 4)
+        return np.ascontiguousarray(tiles.transpose(0, 2, 1, 3, 4)).reshape(rows * cell_h, columns * cell_w, 4)
+
+    def render(self, state):
+        """ returns the persistent wx.Bitmap, updated with the composed matrix for state """
+        rgba = self.compose(state)
+        h, w, _ = rgba.shape
+        if self._bitmap is None or self._bitmap.GetSize() != (w, h):
+            self._bitmap = wx.Bitmap.FromBufferRGBA(w, h, rgba)
+        else:
+            self._bitmap.CopyFromBuffer(rgba, wx.BitmapBufferFormat_RGBA)
+        return self._bitmap
@@ -0,0 +1,76 @@
+# easing.py
+
+from array import array
+
+try:
+    import pytweening as ptw
+except ImportError:  # pytweening is optional - the curves used by the controls have fallbacks below
+    ptw = None
+
+__all__ = ['EasingTable', 'get_easing']
+
+DEFAULT_SAMPLES = 256
+
+# pure python versions of the pytweening curves used by the controls, used if pytweening isn't installed
+_FALLBACKS = {
+    'linear': lambda n: n,
+    'easeInQuad': lambda n: n ** 2,
+    'easeOutQuad': lambda n: -n * (n - 2),
+    'easeInQuart': lambda n: n ** 4,
+    'easeOutQuart': lambda n: 1 - (n - 1) ** 4,
+    'easeInExpo': lambda n: 0 if n == 0 else 2 ** (10 * (n - 1)),
+    'easeOutExpo': lambda n: 1 if n == 1 else 1 - 2 ** (-10 * n),
+}
+
+_tables = {}  # shared tables -> {(curve, samples): EasingTable}
+
+
+class EasingTable:
+    """
+    An easing curve sampled once into a compact array('f') lookup table
+    Calling the table with a progress value (0-1) linearly interpolates between the two nearest samples
+
+    :param curve:   callable mapping progress (0-1) to eased progress - eg a pytweening function
+    :param samples: Int (>= 2) - the number of samples taken across the curve
+    """
+
+    def __init__(self, curve, samples=DEFAULT_SAMPLES):
+        if samples < 2:
+            raise ValueError('samples: Expected a value of 2 or more')
+        last = samples - 1
+        self._last = last
+        self.table = array('f', (curve(i / last) for i in range(samples)))
+
+    def __call__(self, progress):
+        if progress <= 0:
+            return self.table[0]
+        if progress >= 1:
+            return self.table[self._last]
+        position = progress * self._last
+        index = int(position)
+        fraction = position - index
+        low = self.table[index]
+        return low + (self.table[index + 1] - low) * fraction
+
+
+def get_easing(curve, samples=DEFAULT_SAMPLES):
+    """
+    Returns the shared EasingTable for a curve
+
+    :param curve:   the name of a pytweening function (eg 'easeOutQuart') or any callable easing function
+    :param samples: Int - the number of samples taken across the curve
+    """
+    key = (curve, samples)
+    table = _tables.get(key)
+    if table is None:
+        if callable(curve):
+            function = curve
+        elif ptw is not None and hasattr(ptw, curve):
+            function = getattr(ptw, curve)
+        elif curve in _FALLBACKS:
+            function = _FALLBACKS[curve]
+        else:
+            raise ValueError(f'Unknown easing curve: {curve}')
+        table = EasingTable(function, samples)
+        _tables[key] = table
+    return table
@@ -0,0 +1,121 @@
+# instrument.py
+
+import functools
+import json
+import time
+import weakref
+
+__all__ = ['enable', 'is_enabled', 'timed_paint', 'stats_for', 'record_refresh', 'record_event', 'record_cache',
+           'registry', 'dump_json', 'reset', 'ControlStats']
+
+# Checked before any recording takes place - instrumentation costs a single global lookup when disabled
+enabled = False
+
+HISTOGRAM_BUCKETS = 24  # power of 2 buckets, in microseconds: <1, <2, <4 ... <2^23 (about 8 seconds)
+
+_registry = weakref.WeakKeyDictionary()  # {window: ControlStats} - entries go when the window is garbage collected
+
+
+class ControlStats:
+    """ Paint timing and counters recorded for a single control (or panel / frame) """
+
+    def __init__(self, window):
+        self.name = f'{type(window).__name__}#{window.GetId()}'
+        self.kind = type(window).__name__
+        self.paint_count = 0
+        self.paint_total = 0.0
+        self.paint_max = 0.0
+        self.paint_histogram = [0] * HISTOGRAM_BUCKETS
+        self.refresh_requests = 0
+        self.events_posted = 0
+        self.cache = {}  # {cache name: [hits, misses]}
+
+    def record_paint(self, duration):
+        self.paint_count += 1
+        self.paint_total += duration
+        self.paint_max = max(self.paint_max, duration)
+        bucket = min(HISTOGRAM_BUCKETS - 1, int(duration * 1e6).bit_length())
+        self.paint_histogram[bucket] += 1
+
+    def as_dict(self):
+        mean = self.paint_total / self.paint_count if self.paint_count else 0.0
+        return {
+            'name': self.name,
+            'kind': self.kind,
+            'paint_count': self.paint_count,
+            'paint_mean_us': round(mean * 1e6, 2),
+            'paint_max_us': round(self.paint_max * 1e6, 2),
+            'paint_histogram_us': {f'<{2 ** bucket}': count
+                                   for bucket, count in enumerate(self.paint_histogram) if count},
+            'refresh_requests': self.refresh_requests,
+            'events_posted': self.events_posted,
+            'cache': {name: {'hits': hits, 'misses': misses,
+                             'hit_rate': round(hits / (hits + misses), 4) if hits + misses else None}
+                      for name, (hits, misses) in self.cache.items()},
+        }
+
+
+def enable(on=True):
+    """ Turn instrumentation on (or off); recorded figures are kept until reset() """
+    global enabled
+    enabled = on
+
+
+def is_enabled():
+    return enabled
+
+
+def stats_for(window):
+    """ Returns the ControlStats for a window, registering it on first use """
+    stats = _registry.get(window)
+    if stats is None:
+        stats = _registry[window] = ControlStats(window)
+    return stats
+
+
+def timed_paint(method):
+    """ Decorator for paint handlers; records the duration of each paint while instrumentation is enabled """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not enabled:
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        result = method(self, *args, **kwargs)  # buffered DCs are released (blitted) before the method returns
+        stats_for(self).record_paint(time.perf_counter() - start)
+        return result
+    return wrapper
+
+
+def record_refresh(window):
+    if enabled:
+        stats_for(window).refresh_requests += 1
+
+
+def record_event(window):
+    if enabled:
+        stats_for(window).events_posted += 1
+
+
+def record_cache(window, name, hit):
+    if enabled:
+        counts = stats_for(window).cache.setdefault(name, [0, 0])
+        counts[not hit] += 1
+
+
+def registry():
+    """ Returns a list of the recorded figures (as dicts) for every instrumented window """
+    return [stats.as_dict() for stats in list(_registry.values())]
+
+
+def dump_json(path=None, indent=2):
+    """ Returns the registry as a JSON string, also writing it to path if one is given """
+    text = json.dumps({'enabled': enabled, 'controls': registry()}, indent=indent)
+    if path:
+        with open(path, 'w') as file:
+            file.write(text + '\n')
+    return text
+
+
+def reset():
+    """ Discard all recorded figures """
+    _registry.clear()
@@ -0,0 +1,85 @@
+# mailbox.py
+
+import threading
+
+import wx
+
+from .animation import get_animator
+from .refresh import RefreshHoldMixin
+
+__all__ = ['ValueMailbox', 'get_mailbox']
+
+_mailbox = None
+_mailbox_lock = threading.Lock()
+
+
+class ValueMailbox:
+    """
+    A thread-safe mailbox for feeding values to controls from any thread
+    Writers only replace the newest value held for a (control, setter) under a short lock; the first write
+    after a drain wakes the GUI thread (a single wx.CallAfter), which then applies every pending value in one
+    pass at the next frame of the shared clock - intermediate values are dropped, so a fast producer can never
+    swamp the event queue. The refreshes requested while a pass is applied are issued as one per window
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._awake = False
+
+    def post(self, target, setter, value):
+        """ Queue value for setter(value) on the GUI thread; replaces any value not yet applied (any thread) """
+        with self._lock:
+            self._pending[(id(target), setter)] = (target, setter, value)
+            wake = not self._awake
+            self._awake = True
+        if wake:
+            wx.CallAfter(self._schedule)
+
+    def _schedule(self):
+        get_animator().schedule(self, 'drain', self.drain)
+
+    def drain(self):
+        """ Apply the newest pending value for each control (GUI thread only)
+            Every value is applied even if a setter raises; the first error is raised once the pass is complete
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._awake = False
+
+        held = {}  # the controls, and the panels they refresh through, hold their refreshes for the whole pass
+        for target, _, _ in pending.values():
+            if isinstance(target, wx.Window) and target:
+                for window in (target, target.GetParent()):
+                    if isinstance(window, RefreshHoldMixin) and id(window) not in held:
+                        held[id(window)] = window
+                        window.hold_refresh()
+
+        errors = []
+        try:
+            for target, setter, value in pending.values():
+                if isinstance(target, wx.Window) and not target:
+                    continue  # the window has been destroyed
+                try:
+                    setter(value)
+                except Exception as error:
+                    errors.append(error)
+        finally:
+            for window in held.values():
+                if window:
+                    window.release_refresh()
+        if errors:
+            raise errors[0]
+
+    def __len__(self):
+        return len(self._pending)
+
+
+def get_mailbox():
+    """ Returns the ValueMailbox shared by all controls """
+    global _mailbox
+    if _mailbox is None:
+        with _mailbox_lock:
+            if _mailbox is None:
+                _mailbox = ValueMailbox()
+    return _mailbox
@@ -0,0 +1,54 @@
+# refresh.py
+
+import wx
+
+__all__ = ['RefreshHoldMixin']
+
+
+class RefreshHoldMixin:
+    """
+    Lets a window hold back its Refresh / RefreshRect calls, then issue them as a single refresh of the area they
+    cover - so a batch of changes (eg the values applied by a mailbox drain) is repainted once
+    Mix in ahead of the wx window class; holds may be nested
+    """
+
+    _refresh_holds = 0
+    _refresh_held = None    # None (nothing held), True (the whole window) or the wx.Rect covering the held refreshes
+    _refresh_erase = False
+
+    def Refresh(self, eraseBackground=True, rect=None):
+        if self._refresh_holds:
+            self._hold_rect(rect, eraseBackground)
+        else:
+            super().Refresh(eraseBackground, rect)
+
+    def RefreshRect(self, rect, eraseBackground=True):
+        if self._refresh_holds:
+            self._hold_rect(rect, eraseBackground)
+        else:
+            super().RefreshRect(rect, eraseBackground)
+
+    def _hold_rect(self, rect, erase):
+        if rect is None or self._refresh_held is True:
+            self._refresh_held = True
+        elif self._refresh_held is None:
+            self._refresh_held = wx.Rect(rect)
+        else:
+            self._refresh_held = self._refresh_held.Union(wx.Rect(rect))
+        self._refresh_erase = self._refresh_erase or erase
+
+    def hold_refresh(self):
+        """ Hold back refreshes until the matching release_refresh """
+        self._refresh_holds += 1
+
+    def release_refresh(self):
+        """ End a hold; once no hold remains, any refreshes held back are issued as one """
+        self._refresh_holds = max(0, self._refresh_holds - 1)
+        if self._refresh_holds or self._refresh_held is None:
+            return
+        held, erase = self._refresh_held, self._refresh_erase
+        self._refresh_held, self._refresh_erase = None, False
+        if held is True:
+            self.Refresh(erase)
+        else:
+            self.RefreshRect(held, erase)
@@ -0,0 +1,140 @@
+# rotation.py
+
+import weakref
+from collections import OrderedDict
+from math import radians
+
+import wx
+
+from . import instrument
+
+__all__ = ['rotate_bmp', 'RotationCache', 'RotationCacheMixin', 'get_rotation_cache', 'clear_rotation_caches']
+
+DEFAULT_RESOLUTION = 0.5            # degrees between cached rotations
+DEFAULT_BYTE_BUDGET = 8 * 1024 ** 2  # approximate pixel memory allowed per cache (32bpp)
+
+# shared caches -> {(id(bitmap), resolution, max_bytes): RotationCache}
+# the controls hold the caches; an entry goes once no control uses it, and a cache keeps its bitmap (so its id) alive
+_caches = weakref.WeakValueDictionary()
+
+
+def rotate_bmp(bmp, deg):
+    """ Returns a copy of bmp rotated by deg (degrees), cropped to the size of the original bitmap """
+    img = bmp.ConvertToImage()
+    img_w, img_h = img.GetSize()
+    rot_img = img.Rotate(radians(deg), (0, 0))
+    rot_w, rot_h = rot_img.GetSize()
+    offset = wx.Point((rot_w // 2) - (img_w // 2), (rot_h // 2) - (img_h // 2))
+    rot_sub_img = rot_img.GetSubImage(wx.Rect(offset, img.GetSize()))
+    return rot_sub_img.ConvertToBitmap()
+
+
+class RotationCache:
+    """
+    Holds rotated copies of a single bitmap, keyed by the angle quantised to the cache resolution
+    Least recently used rotations are discarded once the cache exceeds its byte budget
+
+    :param bitmap:  the wx.Bitmap to be rotated (eg a knob pointer)
+    :param resolution:  degrees (float > 0) between cached rotations; requested angles snap to the nearest step
+    :param max_bytes:   approximate memory budget for the cached bitmaps; None for no limit
+    """
+
+    def __init__(self, bitmap, resolution=DEFAULT_RESOLUTION, max_bytes=DEFAULT_BYTE_BUDGET):
+        if resolution <= 0:
+            raise ValueError('resolution: Expected a value greater than 0')
+        self.bitmap = bitmap
+        self.resolution = resolution
+        self.max_bytes = max_bytes
+        self.steps = max(1, int(round(360 / resolution)))
+        w, h = bitmap.GetSize()
+        self.frame_bytes = w * h * 4
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def nbytes(self):
+        """ Approximate memory held by the cached rotations """
+        return len(self._frames) * self.frame_bytes
+
+    def quantise(self, deg):
+        """ Returns the cache index for an angle """
+        return int(round((deg % 360) / self.resolution)) % self.steps
+
+    def get(self, deg):
+        """ Returns the bitmap rotated to the nearest cached step of deg (degrees) """
+        index = self.quantise(deg)
+        frame = self._frames.get(index)
+        if frame is not None:
+            self._frames.move_to_end(index)
+            self.hits += 1
+            return frame
+        self.misses += 1
+        frame = rotate_bmp(self.bitmap, index * self.resolution)
+        self._frames[index] = frame
+        self._evict()
+        return frame
+
+    def populate(self):
+        """ Eagerly render the full 360 degree sweep (limited by the byte budget) """
+        for index in range(self.steps):
+            if self.max_bytes is not None and (len(self._frames) + 1) * self.frame_bytes > self.max_bytes:
+                break
+            if index not in self._frames:
+                self._frames[index] = rotate_bmp(self.bitmap, index * self.resolution)
+
+    def clear(self):
+        self._frames.clear()
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        while len(self._frames) > 1 and self.nbytes > self.max_bytes:
+            self._frames.popitem(last=False)
+
+
+def get_rotation_cache(bitmap, resolution=DEFAULT_RESOLUTION, max_bytes=DEFAULT_BYTE_BUDGET, populate=False):
+    """
+    Returns the RotationCache shared by every control using the same bitmap object, resolution and byte budget
+    The caller must keep a reference to the cache - it is discarded once no control holds it
+    """
+    key = (id(bitmap), resolution, max_bytes)
+    cache = _caches.get(key)
+    if cache is None or cache.bitmap is not bitmap:
+        cache = RotationCache(bitmap, resolution, max_bytes)
+        _caches[key] = cache
+    if populate:
+        cache.populate()
+    return cache
+
+
+def clear_rotation_caches():
+    """ Discard the rotated bitmaps held by all shared rotation caches; they are rendered again as needed """
+    for cache in list(_caches.values()):
+        cache.clear()
+    _caches.clear()
+
+
+class RotationCacheMixin:
+    """
+    Rotated pointer bitmaps for controls with a rotating dynamic bitmap (self.dynam_bmp), drawn from a shared
+    RotationCache (self._rotation_cache); the control provides _refresh
+    """
+
+    def set_rotation_cache(self, resolution=DEFAULT_RESOLUTION, max_bytes=DEFAULT_BYTE_BUDGET, populate=False):
+        """ Configure the (shared) cache of rotated pointer bitmaps
+            resolution is the angle (degrees) between cached rotations
+            max_bytes limits the memory held (None = no limit); populate renders the full 360 degree sweep immediately
+        """
+        self._rotation_cache = get_rotation_cache(self.dynam_bmp, resolution, max_bytes, populate)
+        self._refresh()
+
+    def _rotated_pointer(self, angle):
+        """ Returns dynam_bmp rotated by angle (degrees), from the rotation cache """
+        hits = self._rotation_cache.hits
+        indicator = self._rotation_cache.get(angle)
+        instrument.record_cache(self, 'rotation', self._rotation_cache.hits != hits)
+        return indicator
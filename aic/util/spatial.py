@@ -0,0 +1,115 @@
+# spatial.py
+
+__all__ = ['GridIndex']
+
+DEFAULT_CELL_SIZE = 64  # pixels
+
+
+class GridIndex:
+    """
+    A uniform grid spatial index of rectangles, for hit-testing and repaint culling amongst many items
+    Each item is listed in every grid cell its rectangle touches, so a point or rectangle query only examines
+    the items in the cells it covers, rather than every item. Items keep the order they were inserted in
+    (their paint / z order) and moving an item keeps its place in that order
+
+    :param cell_size: Int - width and height (pixels) of a grid cell; ideally about the size of a typical item
+    """
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        if cell_size < 1:
+            raise ValueError('cell_size: Expected a value of 1 or more')
+        self.cell_size = cell_size
+        self._cells = {}    # {(column, row): set of items}
+        self._items = {}    # {item: ((x, y, width, height), insertion order)}
+        self._count = 0
+
+    def _cell_span(self, rect):
+        x, y, w, h = rect
+        size = self.cell_size
+        return (range(x // size, (x + max(w, 1) - 1) // size + 1),
+                range(y // size, (y + max(h, 1) - 1) // size + 1))
+
+    def _add_to_cells(self, item, rect):
+        columns, rows = self._cell_span(rect)
+        for column in columns:
+            for row in rows:
+                self._cells.setdefault((column, row), set()).add(item)
+
+    def _remove_from_cells(self, item, rect):
+        columns, rows = self._cell_span(rect)
+        for column in columns:
+            for row in rows:
+                cell = self._cells[(column, row)]
+                cell.discard(item)
+                if not cell:
+                    del self._cells[(column, row)]
+
+    def insert(self, item, rect):
+        """ Add item with the rectangle (x, y, width, height) - placed above every item already in the index """
+        if item in self._items:
+            self.remove(item)
+        rect = tuple(rect)
+        self._count += 1
+        self._items[item] = (rect, self._count)
+        self._add_to_cells(item, rect)
+
+    def remove(self, item):
+        entry = self._items.pop(item, None)
+        if entry is not None:
+            self._remove_from_cells(item, entry[0])
+
+    def move(self, item, rect):
+        """ Update the rectangle of an item already in the index; only the grid cells that differ are touched """
+        old_rect, order = self._items[item]
+        rect = tuple(rect)
+        if self._cell_span(old_rect) != self._cell_span(rect):
+            self._remove_from_cells(item, old_rect)
+            self._add_to_cells(item, rect)
+        self._items[item] = (rect, order)
+
+    def at(self, point):
+        """ Returns the items whose rectangles contain point, top-most (last inserted) first """
+        px, py = point
+        size = self.cell_size
+        hits = []
+        for item in self._cells.get((px // size, py // size), ()):
+            (x, y, w, h), order = self._items[item]
+            if x <= px < x + w and y <= py < y + h:
+                hits.append((order, item))
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        return [item for _, item in hits]
+
+    def query(self, *rects):
+        """ Returns the items whose rectangles intersect any of rects (x, y, width, height), in insertion order """
+        found = {}
+        for rect in rects:
+            qx, qy, qw, qh = rect
+            if qw <= 0 or qh <= 0:
+                continue
+            columns, rows = self._cell_span((qx, qy, qw, qh))
+            for column in columns:
+                for row in rows:
+                    for item in self._cells.get((column, row), ()):
+                        if item in found:
+                            continue
+                        (x, y, w, h), order = self._items[item]
+                        if x < qx + qw and qx < x + w and y < qy + qh and qy < y + h:
+                            found[item] = order
+        return sorted(found, key=found.get)
+
+    def rect(self, item):
+        return self._items[item][0]
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        """ Iterate over the items in insertion order """
+        return iter(sorted(self._items, key=lambda item: self._items[item][1]))
+
+    def clear(self):
+        self._cells.clear()
+        self._items.clear()
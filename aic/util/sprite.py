@@ -0,0 +1,80 @@
+# sprite.py
+
+from collections import OrderedDict
+
+import wx
+
+__all__ = ['get_tinted_sprite', 'clear_sprite_cache', 'set_sprite_budget']
+
+DEFAULT_BYTE_BUDGET = 4 * 1024 ** 2  # approximate pixel memory allowed for cached sprites (32bpp)
+
+# shared tinted sprites, least recently used first -> {(id(bitmap), rgba, shrink): (bitmap, sprite)}
+_sprites = OrderedDict()
+_budget = {'max_bytes': DEFAULT_BYTE_BUDGET, 'nbytes': 0}
+
+
+def get_tinted_sprite(bitmap, colour, shrink=0):
+    """
+    Returns bitmap composited over a rectangle of colour (deflated by shrink pixels), as a single bitmap
+    Sprites are cached globally, so every LED using the same bitmap, colour and shrink shares one bitmap
+    and painting an LED is a single DrawBitmap; least recently used sprites are discarded once the cache exceeds
+    its byte budget (see set_sprite_budget), so eg. animating an LED's colour doesn't accumulate sprites
+
+    :param bitmap: wx.Bitmap - the LED image, typically a transparency mask
+    :param colour: wx.Colour painted beneath the bitmap
+    :param shrink: Int - reduce the colour rectangle by this many pixels on each side
+    """
+    rgba = tuple(wx.Colour(colour).Get(includeAlpha=True))
+    key = (id(bitmap), rgba, shrink)
+    entry = _sprites.get(key)
+    if entry is not None and entry[0] is bitmap:
+        _sprites.move_to_end(key)
+        return entry[1]
+
+    w, h = bitmap.GetSize()
+    sprite = wx.Bitmap.FromRGBA(w, h, 0, 0, 0, 0)
+    mdc = wx.MemoryDC(sprite)
+    try:
+        dc = wx.GCDC(mdc)
+    except NotImplementedError:
+        dc = mdc
+    dc.SetPen(wx.Pen(wx.Colour(*rgba), width=1))
+    dc.SetBrush(wx.Brush(wx.Colour(*rgba)))
+    # using Deflate to correct for the extra line width added by DrawRectangle
+    dc.DrawRectangle(wx.Rect(0, 0, w, h).Deflate(shrink))
+    dc.DrawBitmap(bitmap, 0, 0)
+    del dc
+    mdc.SelectObject(wx.NullBitmap)
+
+    if entry is not None:
+        _discard(key)  # a stale entry, for a different bitmap that had the same id
+    _sprites[key] = (bitmap, sprite)  # the source bitmap is kept so that its id can't be reused
+    _budget['nbytes'] += w * h * 4
+    _evict()
+    return sprite
+
+
+def _discard(key):
+    _, sprite = _sprites.pop(key)
+    w, h = sprite.GetSize()
+    _budget['nbytes'] -= w * h * 4
+
+
+def _evict():
+    max_bytes = _budget['max_bytes']
+    if max_bytes is None:
+        return
+    while len(_sprites) > 1 and _budget['nbytes'] > max_bytes:
+        _discard(next(iter(_sprites)))
+
+
+def set_sprite_budget(max_bytes=DEFAULT_BYTE_BUDGET):
+    """ Set the approximate memory allowed for cached sprites (None for no limit) """
+    _budget['max_bytes'] = max_bytes
+    _evict()
+
+
+def clear_sprite_cache():
+    """ Discard all cached tinted sprites """
+    _sprites.clear()
+    _budget['nbytes'] = 0
@@ -0,0 +1,165 @@
+import wx
+from wx.lib.newevent import NewCommandEvent
+from aic.util import get_tinted_sprite
+from aic.active_image_control import draw_highlight
+
+wl_cmd_event, EVT_WL_CHANGE = NewCommandEvent()
+
+
+class WindowlessControl:
+    """
+    A lightweight control without a native window
+    Windowless controls are registered with an ImageControlPanel, which paints all of them over its own back
+    buffer in a single paint pass and routes mouse and keyboard input to them - so a panel can host thousands
+    of them without a native window (or a paint event) for each
+
+    Change events are posted from the panel: EVT_WL_CHANGE returns .control (the windowless control) and .value
+
+    :param panel:   the ImageControlPanel hosting the control
+    :param rect:    wx.Rect - the control's position and size on the panel
+    """
+
+    def __init__(self, panel, rect):
+        self.panel = panel
+        self.highlight = True  # draw the focus highlight - the only indication of the (windowless) focus
+        self._rect = wx.Rect(rect)
+        panel.add_windowless(self)
+
+    # Geometry #
+    @property
+    def rect(self):
+        return self._rect
+
+    def set_position(self, pos):
+        self.set_rect(wx.Rect(wx.Point(pos), self._rect.GetSize()))
+
+    def set_rect(self, rect):
+        """ Move / resize the control, repainting the area it left and the area it now covers """
+        old_rect, self._rect = self._rect, wx.Rect(rect)
+        self.panel.move_windowless(self, old_rect)
+
+    def hit_test(self, point):
+        """ Returns True if point (panel co-ordinates) is on the control """
+        return self._rect.Contains(point)
+
+    # Painting #
+    def draw(self, dc):
+        """ Draw the control into dc (panel co-ordinates), over the panel's background - subclasses draw here """
+
+    def draw_highlight(self, dc, sizing=(4, 4)):
+        """ Draw the focus highlight, as the windowed controls do, if highlighting is on and the control has focus """
+        if self.highlight and self.has_focus():
+            draw_highlight(dc, self._rect.GetSize(), (self._rect.GetTopLeft(), sizing))
+
+    def refresh(self):
+        """ Request a repaint of the control's area of the panel """
+        self.panel.refresh_windowless(self)
+
+    # Input #
+    def accepts_focus(self):
+        return False
+
+    def has_focus(self):
+        return self.panel.windowless_focus is self and self.panel.HasFocus()
+
+    def set_highlighting(self, highlight=True):
+        """ Enable focus highlighting """
+        self.highlight = highlight
+        self.refresh()
+
+    def on_mouse(self, event, pos):
+        """ Handle a mouse event on the control; pos is relative to the control's top left corner """
+        event.Skip()
+
+    def on_key(self, event):
+        """ Handle a key event while the control has the (windowless) focus """
+        event.Skip()
+
+    def post_event(self, **kwargs):
+        wx.PostEvent(self.panel, wl_cmd_event(id=self.panel.GetId(), control=self, **kwargs))
+
+    def destroy(self):
+        self.panel.remove_windowless(self)
+
+
+class WindowlessLed(WindowlessControl):
+    """
+    A windowless two state (ON / OFF) LED indicator - see LedSingle
+
+    :param bitmaps: An iterable containing two equally dimensioned wx.Bitmap objects (bmp,bmp)
+                    The  bitmap in (0) position represents the OFF state
+                    The  bitmap in (1) position represents the ON state
+    :param pos:     wx.Point - top left of the LED on the panel
+    """
+
+    def __init__(self, panel, bitmaps, pos=(0, 0)):
+        self.bmp_pair = bitmaps
+        self.bg_colour = wx.GREEN
+        self.colour_shrink = 0  # reduce the rectangle on the back-painted solid colour (if used)
+        self._state = False
+        super().__init__(panel, wx.Rect(wx.Point(pos), self.bmp_pair[0].Size))
+
+    def draw(self, dc):
+        sprite = get_tinted_sprite(self.bmp_pair[self._state], self.bg_colour, self.colour_shrink)
+        dc.DrawBitmap(sprite, self._rect.GetTopLeft())
+
+    # Properties #
+    @property
+    def value(self):
+        return self._state
+
+    @value.setter
+    def value(self, state):
+        if bool(state) != self._state:
+            self._state = bool(state)
+            self.refresh()
+
+
+class WindowlessToggle(WindowlessControl):
+    """
+    A windowless two position ON/OFF switch - see ToggleSwitch
+    Toggled by a left click, or the space key while it has the focus
+
+    :param bitmaps: An iterable containing two equal sized wx.Bitmap objects (bmp,bmp)
+                    The  bitmap in (0) position is treated as the default (OFF) base bitmap
+    :param pos:     wx.Point - top left of the switch on the panel
+    """
+
+    def __init__(self, panel, bitmaps, pos=(0, 0)):
+        self.bmp_pair = bitmaps
+        self._state = False
+        super().__init__(panel, wx.Rect(wx.Point(pos), self.bmp_pair[0].Size))
+
+    def draw(self, dc):
+        dc.DrawBitmap(self.bmp_pair[self._state], self._rect.GetTopLeft())
+        self.draw_highlight(dc)
+
+    def accepts_focus(self):
+        return True
+
+    def on_mouse(self, event, pos):
+        if event.LeftDown() or event.LeftDClick():
+            self.toggle_state()
+        else:
+            event.Skip()
+
+    def on_key(self, event):
+        if event.GetKeyCode() == wx.WXK_SPACE:
+            self.toggle_state()
+        else:
+            event.Skip()
+
+    def toggle_state(self):
+        self._state = not self._state
+        self.refresh()
+        self.post_event(value=self._state)
+
+    # Properties #
+    @property
+    def value(self):
+        return self._state
+
+    @value.setter
+    def value(self, state):
+        if bool(state) != self._state:
+            self.toggle_state()
@@ -1,6 +1,6 @@
 import os
 import wx
-from aic import ImageControlPanel, ImageControlFrame, LedArray, RotaryDial
+from aic import ImageControlPanel, ImageControlFrame, LedArray, RotaryDial, load_bitmap
 
 RESOURCES = 'res'
 
@@ -28,8 +28,8 @@ class ICPanel(ImageControlPanel):
         for i in range(2):
             colourstack = [wx.Colour(25, 225, 25, 200)] * 4
             colourstack.append(wx.Colour(225, 225, 25, 255))
-            ledstuff = (wx.Bitmap(os.path.join(RESOURCES, 'led1rect_inactive_dark_basic2.png')),
-                        wx.Bitmap(os.path.join(RESOURCES, 'led1rect_active_dark_basic2.png')))
+            ledstuff = (load_bitmap(os.path.join(RESOURCES, 'led1rect_inactive_dark_basic2.png')),
+                        load_bitmap(os.path.join(RESOURCES, 'led1rect_active_dark_basic2.png')))
             stack = LedArray(self, ledstuff, colourstack)
             stack.set_padding((15, 10))
             stack.spacing = 1
@@ -51,8 +51,8 @@ class ICPanel(ImageControlPanel):
         for i in range(2):
             colourstack = [wx.Colour(25, 35, 205, 200)] * 4
             colourstack.append(wx.Colour(25, 65, 255, 255))
-            ledstuff = (wx.Bitmap(os.path.join(RESOURCES, 'led1rect_inactive_dark_basic2.png')),
-                        wx.Bitmap(os.path.join(RESOURCES, 'led1rect_active_dark_basic2.png')))
+            ledstuff = (load_bitmap(os.path.join(RESOURCES, 'led1rect_inactive_dark_basic2.png')),
+                        load_bitmap(os.path.join(RESOURCES, 'led1rect_active_dark_basic2.png')))
             stack = LedArray(self, ledstuff, colourstack)
             stack.set_padding((15, 10))
             stack.spacing = 1
@@ -97,8 +97,8 @@ class StdPanel(wx.Panel):
 
         # Add a rotary dial control #
         dial_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1_mark.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1_mark.png')))
         self.dial = RotaryDial(self, dial_pair)
         self.dial.set_padding((10, 10))
         self.dial.set_rotation_point_offset((-1, 0))
@@ -138,7 +138,7 @@ class StdFrame(wx.Frame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """
@@ -180,7 +180,7 @@ class ICFrame(ImageControlFrame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """
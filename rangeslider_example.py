@@ -1,7 +1,7 @@
 import os
 import wx
 import wx.lib.inspection
-from aic import ImageControlPanel, ImageControlFrame
+from aic import ImageControlPanel, ImageControlFrame, load_bitmap
 from aic import RangeSlider
 from aic.range_slider import EVT_RS_CHANGE
 
@@ -48,9 +48,9 @@ class ICPanel(ImageControlPanel):
 
         # Add a single horizontal slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range_handle_lo.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range_handle_hi.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range_handle_lo.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range_handle_hi.png')))
         self.slide = RangeSlider(self, slider_pair, max_pos=220)
         self.slide.set_padding((30, 60))
         self.slide.set_offset((0, 3))
@@ -64,9 +64,9 @@ class ICPanel(ImageControlPanel):
 
         # Add a single inverted horizontal slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range_handle_lo.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range_handle_hi.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range_handle_lo.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range_handle_hi.png')))
         self.islide = RangeSlider(self, slider_pair, is_inverted=True, max_pos=220)
         self.islide.set_padding((30, 60))
         self.islide.set_offset((0, 3))
@@ -84,8 +84,8 @@ class ICPanel(ImageControlPanel):
 
         # Add a single vertical slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range1v.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range_handlev.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range1v.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range_handlev.png')))
         self.vslide = RangeSlider(self, slider_pair, is_vertical=True, is_inverted=False, max_pos=220)
         self.vslide.set_padding((30, 30))
         self.vslide.set_offset((3, 0))
@@ -99,8 +99,8 @@ class ICPanel(ImageControlPanel):
 
         # Add a single inverted vertical slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range1v.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range_handlev.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range1v.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range_handlev.png')))
         self.ivslide = RangeSlider(self, slider_pair, is_vertical=True, is_inverted=True, max_pos=220)
         self.ivslide.set_padding((30, 30))
         self.ivslide.set_offset((3, 0))
@@ -165,8 +165,8 @@ class StdPanel(wx.Panel):
 
         # Add a rotary dial control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_range_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_range_handle.png')))
         self.slider = RangeSlider(self, slider_pair)
         mid_sizer.Add(self.slider, 0, 0, 10)
 
@@ -203,7 +203,7 @@ class StdFrame(wx.Frame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """
@@ -245,7 +245,7 @@ class ICFrame(ImageControlFrame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """
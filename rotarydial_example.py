@@ -1,7 +1,7 @@
 import os
 import wx
 import wx.lib.inspection
-from aic import ImageControlPanel, ImageControlFrame
+from aic import ImageControlPanel, ImageControlFrame, load_bitmap
 from aic import RotaryDial
 from aic.rotary_dial import EVT_RD_CHANGE
 
@@ -30,8 +30,8 @@ class ICPanel(ImageControlPanel):
 
         # Add a rotary dial control #
         dial_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1a.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1a_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1a.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1a_handle.png')))
         self.dial = RotaryDial(self, dial_pair)
         self.dial.set_padding((10, 10))
         self.dial.set_rotation_point_offset((-1, 0))
@@ -86,8 +86,8 @@ class StdPanel(wx.Panel):
 
         # Add a rotary dial control #
         dial_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1_mark.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1_mark.png')))
         self.dial = RotaryDial(self, dial_pair)
         self.dial.set_padding((10, 10))
         self.dial.set_rotation_point_offset((-1, 0))
@@ -133,7 +133,7 @@ class StdFrame(wx.Frame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """
@@ -175,7 +175,7 @@ class ICFrame(ImageControlFrame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """
@@ -2,7 +2,7 @@ import os
 import wx
 import wx.lib.inspection
 
-from aic import ImageControlPanel, ImageControlFrame
+from aic import ImageControlPanel, ImageControlFrame, load_bitmap
 from aic import SimpleSlider
 from aic.simple_slider import EVT_SS_CHANGE
 from aic.util import Padding
@@ -42,8 +42,8 @@ class ICPanel(ImageControlPanel):
 
         # Add a single horizontal slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
         self.slide = SimpleSlider(self, slider_pair, max_pos=210)
         self.slide.set_padding((50, 30))
         self.slide.set_offset((0, 0))
@@ -55,8 +55,8 @@ class ICPanel(ImageControlPanel):
 
         # # Add a single inverted horizontal slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
         self.islide = SimpleSlider(self, slider_pair, max_pos=210)
         self.islide.set_padding((50, 10, 50, 10))
         self.islide.set_default_value(210)
@@ -72,8 +72,8 @@ class ICPanel(ImageControlPanel):
 
         # # Add a single vertical slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1v.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1v.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
         self.vslide = SimpleSlider(self, slider_pair, is_vertical=True, max_pos=210)
         self.vslide.set_padding((30, 40))
         self.vslide.set_default_value(70)
@@ -84,8 +84,8 @@ class ICPanel(ImageControlPanel):
 
         # # Add a single inverted vertical slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1v.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1v.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
         self.ivslide = SimpleSlider(self, slider_pair, is_vertical=True, max_pos=210)
         self.ivslide.set_padding((30, 40))
         self.ivslide.set_step(2, 4)
@@ -144,8 +144,8 @@ class StdPanel(wx.Panel):
 
         # Add a rotary dial control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1_mark.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1_mark.png')))
         self.slider = SimpleSlider(self, slider_pair)
         mid_sizer.Add(self.slider, 0, 0, 10)
 
@@ -182,7 +182,7 @@ class StdFrame(wx.Frame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """
@@ -224,7 +224,7 @@ class ICFrame(ImageControlFrame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """
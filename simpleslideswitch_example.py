@@ -1,7 +1,7 @@
 import os
 import wx
 import wx.lib.inspection
-from aic import ImageControlPanel, ImageControlFrame
+from aic import ImageControlPanel, ImageControlFrame, load_bitmap
 from aic import SimpleSlideSwitch
 from aic.simple_slide_switch import EVT_SSS_CHANGE
 
@@ -40,8 +40,8 @@ class ICPanel(ImageControlPanel):
 
         # Add a single horizontal slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
         self.slide = SimpleSlideSwitch(self, slider_pair, switch_ticks=6, max_pos=210)
         self.slide.set_padding((60, 30))
         self.slide.set_offset((0, 0))
@@ -54,8 +54,8 @@ class ICPanel(ImageControlPanel):
 
         # Add a single inverted horizontal slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
         self.islide = SimpleSlideSwitch(self, slider_pair, switch_ticks=11, max_pos=210)
         self.islide.set_padding((60, 30))
         # self.islide.set_offset((10, 9))
@@ -72,8 +72,8 @@ class ICPanel(ImageControlPanel):
 
         # Add a single vertical slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1v.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1v.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
         self.vslide = SimpleSlideSwitch(self, slider_pair, True, switch_ticks=51, max_pos=210)
         self.vslide.set_padding((30, 60))
         # self.vslide.set_offset((8, 10))
@@ -85,8 +85,8 @@ class ICPanel(ImageControlPanel):
 
         # Add a single inverted vertical slider control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1v.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1v.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_slide1_handle.png')))
         self.ivslide = SimpleSlideSwitch(self, slider_pair, True, switch_ticks=101, max_pos=210)
         self.ivslide.set_padding((30, 60))
         # self.ivslide.set_offset((8, 10))
@@ -146,8 +146,8 @@ class StdPanel(wx.Panel):
 
         # Add a rotary dial control #
         slider_pair = (
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1.png')),
-            wx.Bitmap(os.path.join(RESOURCES, 'sticky_knob1_mark.png')))
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1.png')),
+            load_bitmap(os.path.join(RESOURCES, 'sticky_knob1_mark.png')))
         self.slider = SimpleSlideSwitch(self, slider_pair)
         mid_sizer.Add(self.slider, 0, 0, 10)
 
@@ -184,7 +184,7 @@ class StdFrame(wx.Frame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """
@@ -226,7 +226,7 @@ class ICFrame(ImageControlFrame):
 
         """ Choose a panel """
         # self.main_panel = StdPanel(self)
-        panel_bmp = wx.Bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
+        panel_bmp = load_bitmap(os.path.join(RESOURCES, 'sticky_bg.png'))
         self.main_panel = ICPanel(self, panel_bmp, tiled=True)
 
         """ Optional second panel """